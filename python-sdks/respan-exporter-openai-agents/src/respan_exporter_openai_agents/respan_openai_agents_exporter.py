@@ -1,3 +1,4 @@
+import json
 import logging
 import random
 import threading
@@ -29,9 +30,21 @@ from respan_sdk.constants.llm_logging import (
 )
 from respan_sdk.respan_types.param_types import RespanTextLogParams
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Encode an export payload as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
 def _serialize(obj):
     """Recursively convert *obj* to plain JSON-serializable Python types.
 
@@ -382,7 +395,8 @@ class RespanSpanExporter(BackendSpanExporter):
         if not data:
             return
 
-        payload = {"data": data}
+        # Encoded once so retries resend the same bytes
+        payload = _encode_payload({"data": data})
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -397,7 +411,7 @@ class RespanSpanExporter(BackendSpanExporter):
             attempt += 1
             try:
                 response = self._client.post(
-                    url=self.endpoint, headers=headers, json=payload
+                    url=self.endpoint, headers=headers, content=payload
                 )
 
                 # If the response is successful, break out of the loop
@@ -162,8 +162,9 @@ def main():
     
     # Flush to ensure all spans are exported
     print("\n💾 Flushing spans...")
-    kai.flush()
-    time.sleep(1)  # Give time for async export
+    # flush() blocks until every processor has exported, so no sleep is needed
+    if not kai.flush(timeout_millis=5000):
+        print("⚠️ Flush timed out; some spans may not have been exported")
     
     print("\n" + "=" * 60)
     print("CHECK THE FILES")
@@ -26,6 +26,8 @@ class RespanClient:
     def __init__(self):
         """Initialize the client. Uses the singleton tracer instance."""
         self._tracer = RespanTracer()
+        # OpenTelemetry tracer, resolved on first use and reused afterwards
+        self._otel_tracer = None
     
     def get_current_span(self) -> Optional[Span]:
         """
@@ -269,9 +271,9 @@ class RespanClient:
         span = self.get_current_span()
         return span.is_recording() if span else False
     
-    def flush(self):
-        """Force flush all pending spans."""
-        self._tracer.flush()
+    def flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush all pending spans, waiting at most timeout_millis."""
+        return self._tracer.flush(timeout_millis)
     
     def get_tracer(self):
         """
@@ -298,9 +300,11 @@ class RespanClient:
                 pass
             ```
         """
-        return self._tracer.get_tracer()
+        if self._otel_tracer is None:
+            self._otel_tracer = self._tracer.get_tracer()
+        return self._otel_tracer
     
-    def get_span_buffer(self, trace_id: str) -> SpanBuffer:
+    def get_span_buffer(self, trace_id: str, max_queue_size: Optional[int] = None) -> SpanBuffer:
         """
         Get an OpenTelemetry-compliant context manager for buffering spans with manual export control.
         
@@ -315,6 +319,8 @@ class RespanClient:
         
         Args:
             trace_id: Trace ID for the spans being buffered
+            max_queue_size: Optional cap on buffered spans; the oldest spans are
+                           dropped once it is reached (unbounded if None)
         
         Returns:
             SpanBuffer: Context manager for span buffering
@@ -377,7 +383,7 @@ class RespanClient:
             logger.warning("Respan Telemetry not initialized or disabled.")
             raise RuntimeError("Respan Telemetry not initialized or disabled.")
         
-        return SpanBuffer(trace_id=trace_id)
+        return SpanBuffer(trace_id=trace_id, max_queue_size=max_queue_size)
     
     def process_spans(self, spans) -> bool:
         """
@@ -239,10 +239,11 @@ class RespanTracer:
             return trace.NoOpTracer()
         return self.tracer_provider.get_tracer(name)
     
-    def flush(self):
-        """Force flush all pending spans"""
+    def flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush all pending spans, waiting at most timeout_millis"""
         if hasattr(self, 'tracer_provider'):
-            self.tracer_provider.force_flush()
+            return self.tracer_provider.force_flush(timeout_millis)
+        return True
     
     def _cleanup(self):
         """Cleanup resources on exit"""
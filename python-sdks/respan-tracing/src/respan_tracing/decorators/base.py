@@ -17,11 +17,28 @@ from respan_tracing.constants.context_constants import (
 )
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 P = ParamSpec("P")
 R = TypeVar("R")
 F = TypeVar("F", bound=Callable[P, R | Awaitable[R]])
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize span input/output, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the json module still handles
+            pass
+    return json.dumps(obj)
+
+
 def _is_json_size_valid(json_str: str) -> bool:
     """Check if JSON string size is less than 1MB"""
     return len(json_str) < 1_000_000
@@ -97,7 +114,7 @@ def _handle_span_input(span, args, kwargs):
     """Handle entity input logging"""
     try:
         if _should_send_prompts():
-            json_input = json.dumps({"args": list(args), "kwargs": kwargs})
+            json_input = _json_dumps({"args": list(args), "kwargs": kwargs})
             if _is_json_size_valid(json_input):
                 span.set_attribute(SpanAttributes.TRACELOOP_ENTITY_INPUT, json_input)
     except (TypeError, ValueError) as e:
@@ -108,7 +125,7 @@ def _handle_span_output(span, result):
     """Handle entity output logging"""
     try:
         if _should_send_prompts():
-            json_output = json.dumps(result)
+            json_output = _json_dumps(result)
             if _is_json_size_valid(json_output):
                 span.set_attribute(SpanAttributes.TRACELOOP_ENTITY_OUTPUT, json_output)
     except (TypeError, ValueError) as e:
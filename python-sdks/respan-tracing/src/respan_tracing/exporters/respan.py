@@ -63,10 +63,36 @@ class ModifiedSpan:
         return getattr(self._original_span, name)
 
 
+def _convert_list_value(value: Any) -> Dict[str, Any]:
+    """Convert a list/tuple attribute value to an OTLP JSON array wrapper."""
+    converted = []
+    for item in value:
+        v = _convert_attribute_value(item)
+        if v is not None:
+            converted.append(v)
+    return {OTLP_ARRAY_VALUE: {OTLP_ARRAY_VALUES_KEY: converted}}
+
+
+# Exact-type dispatch for the attribute types OTel allows; subclasses (e.g.
+# enums) fall through to the isinstance chain in _convert_attribute_value
+_ATTRIBUTE_CONVERTERS = {
+    str: lambda value: {OTLP_STRING_VALUE: value},
+    bool: lambda value: {OTLP_BOOL_VALUE: value},
+    int: lambda value: {OTLP_INT_VALUE: str(value)},
+    float: lambda value: {OTLP_DOUBLE_VALUE: value},
+    bytes: lambda value: {OTLP_BYTES_VALUE: base64.b64encode(value).decode("ascii")},
+    list: _convert_list_value,
+    tuple: _convert_list_value,
+}
+
+
 def _convert_attribute_value(value: Any) -> Optional[Dict[str, Any]]:
     """Convert a Python attribute value to OTLP JSON typed wrapper."""
     if value is None:
         return None
+    converter = _ATTRIBUTE_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
     if isinstance(value, bool):
         return {OTLP_BOOL_VALUE: value}
     if isinstance(value, int):
@@ -78,12 +104,7 @@ def _convert_attribute_value(value: Any) -> Optional[Dict[str, Any]]:
     if isinstance(value, bytes):
         return {OTLP_BYTES_VALUE: base64.b64encode(value).decode("ascii")}
     if isinstance(value, (list, tuple)):
-        converted = []
-        for item in value:
-            v = _convert_attribute_value(item)
-            if v is not None:
-                converted.append(v)
-        return {OTLP_ARRAY_VALUE: {OTLP_ARRAY_VALUES_KEY: converted}}
+        return _convert_list_value(value)
     # Fallback: stringify
     return {OTLP_STRING_VALUE: str(value)}
 
@@ -107,13 +128,11 @@ def _span_to_otlp_json(span: ReadableSpan) -> Dict[str, Any]:
     trace_id = format(ctx.trace_id, "032x") if ctx else ""
     span_id = format(ctx.span_id, "016x") if ctx else ""
 
-    # Parent span ID
+    # Parent span ID (ModifiedSpan reports no parent for root-promoted spans)
     parent_span_id = ""
-    parent = getattr(span, "parent", None)
-    if parent is not None:
-        parent_sid = getattr(parent, "span_id", None)
-        if parent_sid:
-            parent_span_id = format(parent_sid, "016x")
+    parent = span.parent
+    if parent is not None and parent.span_id:
+        parent_span_id = format(parent.span_id, "016x")
 
     # Timestamps as nanosecond strings
     start_time_ns = str(span.start_time) if span.start_time else "0"
@@ -172,7 +191,7 @@ def _span_to_otlp_json(span: ReadableSpan) -> Dict[str, Any]:
 
 def _get_resource_key(span: ReadableSpan) -> str:
     """Build a hashable key for grouping spans by resource."""
-    resource = getattr(span, "resource", None)
+    resource = span.resource
     if not resource or not resource.attributes:
         return ""
     # Sort for deterministic keys
@@ -181,7 +200,7 @@ def _get_resource_key(span: ReadableSpan) -> str:
 
 def _get_scope_key(span: ReadableSpan) -> str:
     """Build a hashable key for grouping spans by instrumentation scope."""
-    scope = getattr(span, "instrumentation_scope", None)
+    scope = span.instrumentation_scope
     if not scope:
         return ""
     return f"{scope.name or ''}|{scope.version or ''}"
@@ -198,19 +217,25 @@ def _build_otlp_payload(spans: Sequence[ReadableSpan]) -> Dict[str, Any]:
     resource_attrs_map: Dict[str, Any] = {}
     scope_info_map: Dict[str, Any] = {}
 
+    # Spans from one TracerProvider share the same Resource object, so the
+    # (JSON-serialized) resource key is computed once per distinct resource
+    resource_keys_by_id: Dict[int, str] = {}
+
     for span in spans:
-        r_key = _get_resource_key(span)
+        resource = span.resource
+        r_key = resource_keys_by_id.get(id(resource))
+        if r_key is None:
+            r_key = _get_resource_key(span)
+            resource_keys_by_id[id(resource)] = r_key
         s_key = _get_scope_key(span)
 
         if r_key not in resource_groups:
             resource_groups[r_key] = {}
-            resource = getattr(span, "resource", None)
             resource_attrs_map[r_key] = resource.attributes if resource else {}
 
         if s_key not in resource_groups[r_key]:
             resource_groups[r_key][s_key] = []
-            scope = getattr(span, "instrumentation_scope", None)
-            scope_info_map[s_key] = scope
+            scope_info_map[s_key] = span.instrumentation_scope
 
         resource_groups[r_key][s_key].append(_span_to_otlp_json(span))
 
@@ -256,7 +281,18 @@ class RespanSpanExporter:
         api_key: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 30,
+        session: Optional[requests.Session] = None,
     ):
+        """
+        Args:
+            endpoint: Base URL of the Respan API
+            api_key: API key sent as a Bearer token
+            headers: Extra headers sent with every export request
+            timeout: Request timeout in seconds
+            session: Optional pre-built requests.Session (e.g. with a custom
+                transport adapter mounted). The exporter adds its headers to
+                it and closes it on shutdown.
+        """
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
@@ -264,7 +300,7 @@ class RespanSpanExporter:
 
         # Persistent session for TCP connection reuse across export() calls.
         # At 1% prod sampling with 3-5 traces per request, connection overhead matters.
-        self._session = requests.Session()
+        self._session = session if session is not None else requests.Session()
         self._session.headers.update({
             "Content-Type": "application/json",
             # Anti-recursion marker: tells the server "don't emit new traces
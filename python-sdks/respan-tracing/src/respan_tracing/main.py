@@ -31,7 +31,10 @@ class RespanTelemetry:
         block_instruments: Set of instruments to explicitly disable
         headers: Additional headers to send with telemetry data
         resource_attributes: Additional resource attributes to attach to all spans
-        span_postprocess_callback: Optional callback to process spans before export
+        span_postprocess_callback: Optional callback to process spans before export.
+                                  Runs synchronously on the thread that ends each span,
+                                  before the span is queued for export, so keep it cheap
+                                  and hand heavy work (e.g. serialization) to a queue.
         is_enabled: Whether telemetry is enabled (if False, becomes no-op)
     
     Example:
@@ -123,10 +126,13 @@ class RespanTelemetry:
             is_enabled=is_enabled,
         )
         
+        # Log through the Respan logger: module-level logging.info() would
+        # implicitly basicConfig() the root logger, which then also emits
+        # third-party (httpx, openai, urllib3) records once root is lowered to DEBUG
         if is_enabled:
-            logging.info(f"Respan telemetry initialized")
+            get_main_logger().info("Respan telemetry initialized")
         else:
-            logging.info("Respan telemetry is disabled")
+            get_main_logger().info("Respan telemetry is disabled")
 
     def _configure_logging(self, log_level: Union[str, int]):
         """Configure logging level for Respan tracing"""
@@ -197,9 +203,17 @@ class RespanTelemetry:
             is_batching_enabled=is_batching_enabled,
         )
     
-    def flush(self):
-        """Force flush all pending spans"""
-        self.tracer.flush()
+    def flush(self, timeout_millis: int = 30000) -> bool:
+        """
+        Force flush all pending spans, blocking until they are exported.
+        
+        Args:
+            timeout_millis: Maximum time to wait for the flush to complete
+        
+        Returns:
+            True if all processors flushed within the timeout
+        """
+        return self.tracer.flush(timeout_millis)
     
     def is_initialized(self) -> bool:
         """Check if telemetry is initialized"""
@@ -210,9 +224,9 @@ class RespanTelemetry:
         Get a client for interacting with the current trace/span context.
         
         Returns:
-            RespanClient instance for trace operations.
+            The shared RespanClient instance (same as the module-level get_client()).
         """
-        return RespanClient()
+        return get_client()
 
     # Expose decorators as instance methods for backward compatibility
     workflow = staticmethod(workflow)
@@ -1,6 +1,8 @@
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Deque, Set, Tuple
+from collections import deque
 from contextvars import ContextVar
 import logging
+import threading
 
 from opentelemetry import context as context_api, trace
 from opentelemetry.sdk.trace import SpanProcessor, ReadableSpan
@@ -19,6 +21,13 @@ from respan_tracing.utils.context import get_entity_path
 
 logger = logging.getLogger(__name__)
 
+# Attribute keys read/written for every span, resolved once at import
+_TRACELOOP_SPAN_KIND = SpanAttributes.TRACELOOP_SPAN_KIND
+_TRACELOOP_ENTITY_NAME = SpanAttributes.TRACELOOP_ENTITY_NAME
+_TRACELOOP_ENTITY_PATH = SpanAttributes.TRACELOOP_ENTITY_PATH
+_TRACELOOP_WORKFLOW_NAME = SpanAttributes.TRACELOOP_WORKFLOW_NAME
+_RESPAN_TRACE_GROUP_ID = RespanSpanAttributes.RESPAN_TRACE_GROUP_ID.value
+
 
 class RespanSpanProcessor:
     """
@@ -44,30 +53,30 @@ class RespanSpanProcessor:
         # Check if this span is being created within an entity context
         # If so, add the entityPath attribute so it gets preserved by our filtering
         entity_path = get_entity_path(parent_context)  # Use active context like JS version
-        if entity_path and not span.attributes.get(SpanAttributes.TRACELOOP_SPAN_KIND):
+        if entity_path and not span.attributes.get(_TRACELOOP_SPAN_KIND):
             # This is an auto-instrumentation span within an entity context
             # Add the entityPath attribute so it doesn't get filtered out
             logger.debug(
-                f"[Respan Debug] Adding entityPath to auto-instrumentation span: {span.name} (entityPath: {entity_path})"
+                "[Respan Debug] Adding entityPath to auto-instrumentation span: %s (entityPath: %s)",
+                span.name,
+                entity_path,
             )
-            span.set_attribute(SpanAttributes.TRACELOOP_ENTITY_PATH, entity_path)
+            span.set_attribute(_TRACELOOP_ENTITY_PATH, entity_path)
 
         # Add workflow name if present in context
-        workflow_name = context_api.get_value(SpanAttributes.TRACELOOP_ENTITY_NAME)
+        workflow_name = context_api.get_value(_TRACELOOP_ENTITY_NAME)
         if workflow_name:
-            span.set_attribute(SpanAttributes.TRACELOOP_WORKFLOW_NAME, workflow_name)
+            span.set_attribute(_TRACELOOP_WORKFLOW_NAME, workflow_name)
 
         # Add entity path if present in context (for redundancy)
-        entity_path_from_context = context_api.get_value(SpanAttributes.TRACELOOP_ENTITY_PATH)
+        entity_path_from_context = context_api.get_value(_TRACELOOP_ENTITY_PATH)
         if entity_path_from_context:
-            span.set_attribute(SpanAttributes.TRACELOOP_ENTITY_PATH, entity_path_from_context)
+            span.set_attribute(_TRACELOOP_ENTITY_PATH, entity_path_from_context)
 
         # Add trace group identifier if present
         trace_group_id = context_api.get_value(TRACE_GROUP_ID_KEY)
         if trace_group_id:
-            span.set_attribute(
-                RespanSpanAttributes.RESPAN_TRACE_GROUP_ID.value, trace_group_id
-            )
+            span.set_attribute(_RESPAN_TRACE_GROUP_ID, trace_group_id)
 
         # Add custom parameters if present
         respan_params = context_api.get_value(PARAMS_KEY)
@@ -84,7 +93,7 @@ class RespanSpanProcessor:
         if should_process_span(span):
             self.processor.on_end(span)
         else:
-            logger.debug(f"[Respan Debug] Skipping filtered span: {span.name}")
+            logger.debug("[Respan Debug] Skipping filtered span: %s", span.name)
 
     def _wrapped_on_end(self, span: ReadableSpan):
         """Wrapped on_end method that calls custom callback first"""
@@ -111,6 +120,13 @@ _active_span_buffer: ContextVar[Optional['SpanBuffer']] = ContextVar(
     'active_span_buffer', default=None
 )
 
+# Number of SpanBuffers currently entered anywhere in the process. While it is
+# zero, BufferingSpanProcessor.on_end skips the ContextVar lookup entirely.
+# A process-wide count (rather than a thread-local flag) stays correct when the
+# buffer's context is propagated into worker threads or asyncio tasks.
+_active_buffer_count = 0
+_active_buffer_count_lock = threading.Lock()
+
 
 class BufferingSpanProcessor(SpanProcessor):
     """
@@ -152,16 +168,22 @@ class BufferingSpanProcessor(SpanProcessor):
         Args:
             span: The span that ended
         """
+        # Fast path: no SpanBuffer is entered anywhere, so skip the ContextVar lookup
+        if not _active_buffer_count:
+            self.original_processor.on_end(span)
+            return
+        
         # Check if there's an active SpanBuffer in this context
         buffer = _active_span_buffer.get()
         
         if buffer is not None and buffer._is_buffering:
             # Route to the buffer's local queue
             logger.debug(
-                f"[SpanBuffer] Buffering span '{span.name}' "
-                f"for trace {buffer.trace_id}"
+                "[SpanBuffer] Buffering span '%s' for trace %s",
+                span.name,
+                buffer.trace_id,
             )
-            buffer._local_queue.append(span)
+            buffer._append_span(span)
         else:
             # No active buffer - use original processor (normal export)
             self.original_processor.on_end(span)
@@ -227,10 +249,10 @@ class FilteringSpanProcessor(SpanProcessor):
     def on_end(self, span: ReadableSpan):
         """Called when a span ends - only export if filter matches."""
         if self.filter_fn(span):
-            logger.debug(f"[FilteringProcessor] Exporting span: {span.name}")
+            logger.debug("[FilteringProcessor] Exporting span: %s", span.name)
             self.processor.on_end(span)
         else:
-            logger.debug(f"[FilteringProcessor] Filtering out span: {span.name}")
+            logger.debug("[FilteringProcessor] Filtering out span: %s", span.name)
     
     def shutdown(self):
         """Shutdown the processor."""
@@ -241,6 +263,28 @@ class FilteringSpanProcessor(SpanProcessor):
         return self.processor.force_flush(timeout_millis)
 
 
+_span_buffer_tracer: Optional[trace.Tracer] = None
+
+
+def _get_span_buffer_tracer() -> trace.Tracer:
+    """
+    Get the tracer used by SpanBuffer.create_span, resolving it only once.
+
+    trace.get_tracer() returns a proxy until a global provider is installed,
+    so caching the result is safe even if it is first called early.
+    """
+    global _span_buffer_tracer
+    if _span_buffer_tracer is None:
+        _span_buffer_tracer = trace.get_tracer("respan.span_buffer")
+    return _span_buffer_tracer
+
+
+def _span_key(span: ReadableSpan) -> Tuple[Any, Any]:
+    """Identify a span by its trace and span ids"""
+    span_context = span.context
+    return span_context.trace_id, span_context.span_id
+
+
 class SpanBuffer:
     """
     OpenTelemetry-compliant context manager for buffering spans.
@@ -261,15 +305,20 @@ class SpanBuffer:
     5. Thread-safe isolation (each context has its own buffer)
     """
     
-    def __init__(self, trace_id: str):
+    def __init__(self, trace_id: str, max_queue_size: Optional[int] = None):
         """
         Initialize the span buffer.
         
         Args:
             trace_id: Trace ID for the spans being buffered
+            max_queue_size: Optional cap on the number of buffered spans. When the
+                           queue is full the oldest span is dropped for each new one
+                           (see get_dropped_count()). Unbounded if None.
         """
         self.trace_id = trace_id
-        self._local_queue: List[ReadableSpan] = []
+        self._local_queue: Deque[ReadableSpan] = deque(maxlen=max_queue_size)
+        self._span_keys: Set[Tuple[Any, Any]] = set()
+        self._dropped_count = 0
         self._is_buffering = False
         self._context_token = None
     
@@ -283,7 +332,7 @@ class SpanBuffer:
         Returns:
             self for context manager usage
         """
-        logger.debug(f"[SpanBuffer] Entering buffering context for trace {self.trace_id}")
+        logger.debug("[SpanBuffer] Entering buffering context for trace %s", self.trace_id)
         
         # Mark as buffering
         self._is_buffering = True
@@ -291,7 +340,11 @@ class SpanBuffer:
         # Set this buffer as active in the context variable
         self._context_token = _active_span_buffer.set(self)
         
-        logger.debug(f"[SpanBuffer] Activated buffer for trace {self.trace_id}")
+        global _active_buffer_count
+        with _active_buffer_count_lock:
+            _active_buffer_count += 1
+        
+        logger.debug("[SpanBuffer] Activated buffer for trace %s", self.trace_id)
         
         return self
     
@@ -304,7 +357,7 @@ class SpanBuffer:
             exc_val: Exception value if an exception was raised
             exc_tb: Exception traceback if an exception was raised
         """
-        logger.debug(f"[SpanBuffer] Exiting buffering context for trace {self.trace_id}")
+        logger.debug("[SpanBuffer] Exiting buffering context for trace %s", self.trace_id)
         
         # Mark as not buffering
         self._is_buffering = False
@@ -313,8 +366,12 @@ class SpanBuffer:
         if self._context_token is not None:
             _active_span_buffer.reset(self._context_token)
             self._context_token = None
+            
+            global _active_buffer_count
+            with _active_buffer_count_lock:
+                _active_buffer_count -= 1
         
-        logger.debug(f"[SpanBuffer] Deactivated buffer for trace {self.trace_id}")
+        logger.debug("[SpanBuffer] Deactivated buffer for trace %s", self.trace_id)
         
         # Note: Local queue persists for manual export or inspection
         # It will be cleaned up by garbage collection when this object is destroyed
@@ -336,32 +393,52 @@ class SpanBuffer:
         Returns:
             The span ID as a hex string
         """
-        tracer = trace.get_tracer("respan.span_buffer")
+        tracer = _get_span_buffer_tracer()
         
         # Set span kind
         span_kind = kind or trace.SpanKind.INTERNAL
         
-        # Create span in context
-        with tracer.start_as_current_span(span_name, kind=span_kind) as span:
-            # Set trace ID if we can (note: trace_id is already set by the tracer)
-            # We just use the provided trace_id for logging/tracking purposes
-            
-            # Set attributes
-            if attributes:
-                for key, value in attributes.items():
-                    try:
-                        span.set_attribute(key, value)
-                    except (ValueError, TypeError) as e:
-                        logger.warning(
-                            f"[SpanBuffer] Failed to set attribute {key}={value}: {e}"
-                        )
-            
-            # Span goes to local queue when this context exits
-            span_id = format(span.get_span_context().span_id, '016x')
-            logger.debug(f"[SpanBuffer] Created span '{span_name}' with ID {span_id}")
-            
+        # Start and end the span directly instead of making it the current span:
+        # nothing runs inside it, so attaching/detaching context is pure overhead.
+        # Attributes are passed at creation; invalid values are dropped (with a
+        # warning) by the SDK's attribute validation.
+        # The span's trace ID comes from the tracer; the provided trace_id is used
+        # for logging/tracking purposes only.
+        span = tracer.start_span(span_name, kind=span_kind, attributes=attributes)
+        span_id = format(span.get_span_context().span_id, '016x')
+        
+        # Span goes to local queue when it ends
+        span.end()
+        logger.debug("[SpanBuffer] Created span '%s' with ID %s", span_name, span_id)
+
         return span_id
     
+    def _append_span(self, span: ReadableSpan):
+        """
+        Add an ended span to the local queue.
+        
+        Each registered processor has its own BufferingSpanProcessor and the
+        provider hands the same span to each of them in turn, so spans are
+        de-duplicated by span id.
+        """
+        key = _span_key(span)
+        if key in self._span_keys:
+            return
+        
+        queue = self._local_queue
+        if queue.maxlen is not None and len(queue) == queue.maxlen:
+            if not self._dropped_count:
+                logger.warning(
+                    "[SpanBuffer] Buffer for trace %s is full (%d spans), dropping oldest spans",
+                    self.trace_id,
+                    queue.maxlen,
+                )
+            self._dropped_count += 1
+            self._span_keys.discard(_span_key(queue[0]))
+        
+        queue.append(span)
+        self._span_keys.add(key)
+    
     def get_all_spans(self) -> List[ReadableSpan]:
         """
         Get all spans from the local queue.
@@ -369,7 +446,7 @@ class SpanBuffer:
         Returns:
             List of all buffered spans
         """
-        return self._local_queue.copy()
+        return list(self._local_queue)
     
     def process_spans(self, tracer_provider) -> int:
         """
@@ -385,13 +462,12 @@ class SpanBuffer:
             Number of spans processed
         """
         if not self._local_queue:
-            logger.debug(f"[SpanBuffer] No spans to process for trace {self.trace_id}")
+            logger.debug("[SpanBuffer] No spans to process for trace %s", self.trace_id)
             return 0
         
         span_count = len(self._local_queue)
         logger.info(
-            f"[SpanBuffer] Processing {span_count} spans "
-            f"for trace {self.trace_id}"
+            "[SpanBuffer] Processing %d spans for trace %s", span_count, self.trace_id
         )
         
         try:
@@ -401,16 +477,14 @@ class SpanBuffer:
                 for span in self._local_queue:
                     tracer_provider._active_span_processor.on_end(span)
                 
-                logger.info(
-                    f"[SpanBuffer] Successfully processed {span_count} spans"
-                )
+                logger.info("[SpanBuffer] Successfully processed %d spans", span_count)
                 return span_count
             else:
                 logger.error("[SpanBuffer] No active span processor found")
                 return 0
             
         except Exception as e:
-            logger.exception(f"[SpanBuffer] Exception during processing: {e}")
+            logger.exception("[SpanBuffer] Exception during processing: %s", e)
             return 0
     
     def clear_spans(self):
@@ -421,7 +495,8 @@ class SpanBuffer:
         """
         span_count = len(self._local_queue)
         self._local_queue.clear()
-        logger.debug(f"[SpanBuffer] Cleared {span_count} spans from queue")
+        self._span_keys.clear()
+        logger.debug("[SpanBuffer] Cleared %d spans from queue", span_count)
     
     def get_span_count(self) -> int:
         """
@@ -431,3 +506,12 @@ class SpanBuffer:
             Number of buffered spans
         """
         return len(self._local_queue)
+    
+    def get_dropped_count(self) -> int:
+        """
+        Get the number of spans dropped because the queue was full.
+        
+        Returns:
+            Number of dropped spans (always 0 for an unbounded buffer)
+        """
+        return self._dropped_count
@@ -5,6 +5,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Attribute keys checked for every span, resolved once at import
+_TRACELOOP_SPAN_KIND = SpanAttributes.TRACELOOP_SPAN_KIND
+_TRACELOOP_ENTITY_PATH = SpanAttributes.TRACELOOP_ENTITY_PATH
+
 
 def should_process_span(span: ReadableSpan) -> bool:
     """
@@ -21,27 +25,32 @@ def should_process_span(span: ReadableSpan) -> bool:
     Returns:
         bool: True if span should be processed, False if it should be filtered out
     """
-    span_kind = span.attributes.get(SpanAttributes.TRACELOOP_SPAN_KIND)
-    entity_path = span.attributes.get(SpanAttributes.TRACELOOP_ENTITY_PATH, "")
+    span_kind = span.attributes.get(_TRACELOOP_SPAN_KIND)
+    entity_path = span.attributes.get(_TRACELOOP_ENTITY_PATH, "")
     
     # User-decorated span (has TRACELOOP_SPAN_KIND)
     if span_kind:
         logger.debug(
-            f"[Respan Debug] Processing user-decorated span: {span.name} (kind: {span_kind})"
+            "[Respan Debug] Processing user-decorated span: %s (kind: %s)",
+            span.name,
+            span_kind,
         )
         return True
     
     # Child span within entity context (has TRACELOOP_ENTITY_PATH)
     elif entity_path and entity_path != "":
         logger.debug(
-            f"[Respan Debug] Processing child span within entity context: {span.name} (entityPath: {entity_path})"
+            "[Respan Debug] Processing child span within entity context: %s (entityPath: %s)",
+            span.name,
+            entity_path,
         )
         return True
     
     # Auto-instrumentation noise - filter out
     else:
         logger.debug(
-            f"[Respan Debug] Filtering out auto-instrumentation span: {span.name} (no TRACELOOP_SPAN_KIND or entityPath)"
+            "[Respan Debug] Filtering out auto-instrumentation span: %s (no TRACELOOP_SPAN_KIND or entityPath)",
+            span.name,
         )
         return False
 
@@ -59,13 +68,13 @@ def should_make_root_span(span: ReadableSpan) -> bool:
     Returns:
         bool: True if span should be made a root span
     """
-    span_kind = span.attributes.get(SpanAttributes.TRACELOOP_SPAN_KIND)
-    entity_path = span.attributes.get(SpanAttributes.TRACELOOP_ENTITY_PATH, "")
+    span_kind = span.attributes.get(_TRACELOOP_SPAN_KIND)
+    entity_path = span.attributes.get(_TRACELOOP_ENTITY_PATH, "")
     
     # User-decorated span without entity path should become root
     is_root_candidate = span_kind is not None and (not entity_path or entity_path == "")
     
     if is_root_candidate:
-        logger.debug(f"[Respan Debug] Span should be made root: {span.name}")
+        logger.debug("[Respan Debug] Span should be made root: %s", span.name)
     
     return is_root_candidate
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for respan-tracing tests.
+"""
+
+import pytest
+
+from respan_tracing import RespanTelemetry, get_client
+from respan_tracing.core.tracer import RespanTracer
+
+# The tracing-tests scripts are run by hand against live providers and make
+# their API calls at import time, so pytest must not collect them.
+collect_ignore_glob = ["tracing-tests/*"]
+
+
+@pytest.fixture(scope="session")
+def telemetry():
+    """Initialize telemetry once per test session.
+
+    The global client is created here as well so that the first test using
+    it does not pay for its construction.
+    """
+    telemetry = RespanTelemetry(
+        app_name="test-app",
+        api_key="test-key",
+        is_enabled=True,
+    )
+    get_client()
+    return telemetry
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _flush_all():
+    """Flush pending spans once at the end of the session instead of per test."""
+    yield
+    if RespanTracer.is_initialized():
+        try:
+            RespanTracer().flush()
+        except Exception:
+            pass
@@ -157,6 +157,11 @@ def test_module_level_get_client():
     assert isinstance(client, RespanClient)
 
 
+def test_telemetry_get_client_returns_global_client(telemetry):
+    """Test that the telemetry instance hands out the shared global client"""
+    assert telemetry.get_client() is get_client()
+
+
 if __name__ == "__main__":
     # Run a simple test
     test = TestRespanClient()
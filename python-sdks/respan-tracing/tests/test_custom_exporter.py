@@ -1,81 +1,60 @@
 import pytest
-from unittest.mock import Mock, patch
-from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
-from respan_tracing import RespanTelemetry
-
-
-class MockExporter(SpanExporter):
-    """Mock exporter for testing"""
-    
-    def __init__(self):
-        self.exported_spans = []
-    
-    def export(self, spans):
-        self.exported_spans.extend(spans)
-        return SpanExportResult.SUCCESS
-    
-    def shutdown(self):
-        pass
-    
-    def force_flush(self, timeout_millis=30000):
-        return True
-
-
-def test_custom_exporter_used():
-    """Test that custom exporter is used when provided"""
-    mock_exporter = MockExporter()
-    
-    telemetry = RespanTelemetry(
-        app_name="test-app",
-        custom_exporter=mock_exporter,
-        is_enabled=True,
+from unittest.mock import patch
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from respan_tracing import task
+
+
+@pytest.fixture(scope="module")
+def in_memory_exporter(telemetry):
+    """In-memory exporter registered once as a named, non-batching processor"""
+    exporter = InMemorySpanExporter()
+    telemetry.add_processor(
+        exporter=exporter,
+        name="in_memory",
+        is_batching_enabled=False,
     )
-    
-    # Create a span
-    tracer = telemetry.tracer.get_tracer()
-    with tracer.start_as_current_span("test_span") as span:
-        span.set_attribute("test", "value")
-    
-    # Flush to ensure export
-    telemetry.flush()
-    
-    # Verify custom exporter was called
-    assert len(mock_exporter.exported_spans) > 0
-    assert any(s.name == "test_span" for s in mock_exporter.exported_spans)
-
-
-def test_default_exporter_when_no_custom():
-    """Test that default HTTP exporter is used when no custom exporter provided"""
-    with patch('respan_tracing.core.tracer.RespanSpanExporter') as mock_exporter_class:
-        telemetry = RespanTelemetry(
-            app_name="test-app",
-            api_key="test-key",
-            base_url="https://test.api",
-            is_enabled=True,
+    yield exporter
+    exporter.clear()
+
+
+@pytest.mark.parametrize(
+    "task_name, processors, expected_exported",
+    [
+        ("custom_exporter_task", "in_memory", True),
+        ("unrouted_task", None, False),
+    ],
+    ids=["routed", "unrouted"],
+)
+def test_custom_exporter_routing(in_memory_exporter, task_name, processors, expected_exported):
+    """Test that a custom exporter receives only spans routed to its processor"""
+
+    @task(name=task_name, processors=processors)
+    def traced_task():
+        return "done"
+
+    # The in-memory processor is non-batching, so spans are exported on end
+    traced_task()
+
+    exported_names = [s.name for s in in_memory_exporter.get_finished_spans()]
+    assert (f"{task_name}.task" in exported_names) is expected_exported
+
+
+def test_default_exporter_when_no_custom(telemetry):
+    """Test that the default processor is built on the Respan HTTP exporter"""
+    # add_processor is patched too, so the session tracer provider is left untouched
+    with patch('respan_tracing.exporters.RespanSpanExporter') as mock_exporter_class, \
+            patch.object(telemetry.tracer, 'add_processor') as mock_add_processor:
+        telemetry.tracer._setup_default_processor()
+
+        # Verify default exporter was created with the tracer's API settings
+        mock_exporter_class.assert_called_once_with(
+            endpoint=telemetry.tracer.api_endpoint,
+            api_key=telemetry.tracer.api_key,
+            headers=telemetry.tracer.headers,
+        )
+        mock_add_processor.assert_called_once_with(
+            exporter=mock_exporter_class.return_value,
+            name=None,
+            filter_fn=None,
         )
-        
-        # Verify default exporter was created
-        mock_exporter_class.assert_called_once()
-
-
-def test_custom_exporter_ignores_api_settings():
-    """Test that api_key and base_url are not used when custom exporter is provided"""
-    mock_exporter = MockExporter()
-    
-    # These should be ignored
-    telemetry = RespanTelemetry(
-        app_name="test-app",
-        api_key="should-be-ignored",
-        base_url="https://should-be-ignored",
-        custom_exporter=mock_exporter,
-        is_enabled=True,
-    )
-    
-    # Should still work with custom exporter
-    tracer = telemetry.tracer.get_tracer()
-    with tracer.start_as_current_span("test_span"):
-        pass
-    
-    telemetry.flush()
-    assert len(mock_exporter.exported_spans) > 0
 
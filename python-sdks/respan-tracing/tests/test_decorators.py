@@ -0,0 +1,23 @@
+"""
+Unit tests for decorator helpers.
+"""
+
+import json
+
+import pytest
+
+from respan_tracing.decorators.base import _json_dumps
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"args": [1, "two"], "kwargs": {"x": None}},
+        {1: "a", 2: "b"},
+        {"big": 2**70},
+    ],
+    ids=["plain", "non_str_keys", "wide_int"],
+)
+def test_json_dumps_matches_json_module(payload):
+    """Test that span payloads serialize to what json.dumps would produce"""
+    assert json.loads(_json_dumps(payload)) == json.loads(json.dumps(payload))
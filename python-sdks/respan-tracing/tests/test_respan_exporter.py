@@ -0,0 +1,28 @@
+"""
+Tests for RespanSpanExporter.
+"""
+
+import requests
+from unittest.mock import Mock
+
+from respan_tracing.exporters.respan import RespanSpanExporter
+
+
+def test_exporter_uses_injected_session():
+    """Test that an injected session is configured and used instead of a new one"""
+    session = requests.Session()
+    session.post = Mock(return_value=Mock(status_code=200))
+
+    exporter = RespanSpanExporter(
+        endpoint="https://test.respan.ai/api/",
+        api_key="test-key",
+        session=session,
+    )
+
+    assert exporter._session is session
+    assert session.headers["Authorization"] == "Bearer test-key"
+
+    exporter.export([])
+
+    session.post.assert_called_once()
+    assert session.post.call_args.kwargs["url"] == "https://test.respan.ai/api/v2/traces"
@@ -0,0 +1,248 @@
+"""
+Unit tests for SpanBuffer functionality.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from respan_tracing import get_client
+from respan_tracing.processors import SpanBuffer, BufferingSpanProcessor
+from respan_tracing.processors import base as processors_base
+from respan_tracing.processors.base import _active_span_buffer
+
+
+class TestBufferingSpanProcessor:
+    """Tests for BufferingSpanProcessor"""
+    
+    def test_routes_to_buffer_when_active(self):
+        """Test that spans are routed to the active buffer"""
+        # Setup
+        original_processor = Mock()
+        processor = BufferingSpanProcessor(original_processor)
+        
+        # Create a mock span
+        mock_span = Mock()
+        mock_span.name = "test_span"
+        
+        # Enter the buffer so it becomes active
+        with SpanBuffer("test-trace") as buffer:
+            assert processors_base._active_buffer_count == 1
+            
+            # Process the span
+            processor.on_end(mock_span)
+            
+            # Verify span went to the buffer, not original processor
+            assert buffer.get_span_count() == 1
+            assert buffer.get_all_spans()[0] == mock_span
+            original_processor.on_end.assert_not_called()
+        
+        # Leaving the buffer re-enables the fast path
+        assert processors_base._active_buffer_count == 0
+    
+    def test_buffers_span_once_across_processors(self):
+        """Test that a span seen by several processors is buffered only once"""
+        processors = [BufferingSpanProcessor(Mock()), BufferingSpanProcessor(Mock())]
+        
+        mock_span = Mock()
+        mock_span.name = "test_span"
+        
+        with SpanBuffer("test-trace") as buffer:
+            for processor in processors:
+                processor.on_end(mock_span)
+            
+            assert buffer.get_span_count() == 1
+    
+    def test_buffers_interleaved_spans_once(self):
+        """Test that each span is buffered once when two processors see spans interleaved"""
+        processors = [BufferingSpanProcessor(Mock()), BufferingSpanProcessor(Mock())]
+        first, second = Mock(), Mock()
+        
+        with SpanBuffer("test-trace") as buffer:
+            processors[0].on_end(first)
+            processors[0].on_end(second)
+            processors[1].on_end(first)
+            processors[1].on_end(second)
+            
+            assert buffer.get_all_spans() == [first, second]
+    
+    def test_routes_to_original_when_no_buffer(self):
+        """Test that spans go to original processor when no buffer is active"""
+        # Setup
+        original_processor = Mock()
+        processor = BufferingSpanProcessor(original_processor)
+        
+        # Create a mock span
+        mock_span = Mock()
+        mock_span.name = "test_span"
+        
+        # Process the span (no active buffer)
+        processor.on_end(mock_span)
+        
+        # Verify span went to original processor
+        original_processor.on_end.assert_called_once_with(mock_span)
+    
+    def test_forwards_on_start(self):
+        """Test that on_start is forwarded to original processor"""
+        original_processor = Mock()
+        processor = BufferingSpanProcessor(original_processor)
+        
+        mock_span = Mock()
+        mock_context = Mock()
+        
+        processor.on_start(mock_span, mock_context)
+        
+        original_processor.on_start.assert_called_once_with(mock_span, mock_context)
+
+
+class TestSpanBuffer:
+    """Tests for SpanBuffer"""
+    
+    def test_context_manager_sets_active_buffer(self):
+        """Test that entering context sets active buffer"""
+        buffer = SpanBuffer("test-trace")
+        
+        # Before entering context
+        assert _active_span_buffer.get() is None
+        
+        # Enter context
+        with buffer:
+            # Inside context, buffer should be active
+            assert _active_span_buffer.get() == buffer
+            assert buffer._is_buffering is True
+        
+        # After exiting context
+        assert _active_span_buffer.get() is None
+        assert buffer._is_buffering is False
+    
+    def test_create_span_adds_to_queue(self, telemetry):
+        """Test that create_span adds spans to local queue"""
+        buffer = SpanBuffer("test-trace")
+        
+        with buffer:
+            # Create spans
+            buffer.create_span("span1", {"attr1": "value1"})
+            buffer.create_span("span2", {"attr2": "value2"})
+            
+            # Verify spans were added to queue
+            assert buffer.get_span_count() == 2
+            
+            spans = buffer.get_all_spans()
+            assert len(spans) == 2
+            assert spans[0].name == "span1"
+            assert spans[1].name == "span2"
+    
+    def test_process_spans_calls_processor(self):
+        """Test that process_spans sends every span through the processor pipeline"""
+        tracer_provider = Mock()
+        
+        buffer = SpanBuffer("test-trace")
+        
+        # Add mock spans
+        mock_span1 = Mock()
+        mock_span2 = Mock()
+        buffer._local_queue.extend([mock_span1, mock_span2])
+        
+        # Process
+        count = buffer.process_spans(tracer_provider)
+        
+        # Verify
+        assert count == 2
+        processor = tracer_provider._active_span_processor
+        assert processor.on_end.call_count == 2
+        processor.on_end.assert_any_call(mock_span1)
+        processor.on_end.assert_any_call(mock_span2)
+    
+    def test_process_empty_queue(self):
+        """Test processing with empty queue"""
+        tracer_provider = Mock()
+        buffer = SpanBuffer("test-trace")
+        
+        # Process empty queue
+        count = buffer.process_spans(tracer_provider)
+        
+        # Should return 0 without calling the processor
+        assert count == 0
+        tracer_provider._active_span_processor.on_end.assert_not_called()
+    
+    def test_clear_spans(self):
+        """Test clearing spans from queue"""
+        buffer = SpanBuffer("test-trace")
+        
+        # Add mock spans
+        buffer._local_queue.extend([Mock(), Mock(), Mock()])
+        assert buffer.get_span_count() == 3
+        
+        # Clear
+        buffer.clear_spans()
+        
+        # Verify
+        assert buffer.get_span_count() == 0
+    
+    def test_max_queue_size_drops_oldest(self):
+        """Test that a bounded buffer wraps around and counts dropped spans"""
+        processor = BufferingSpanProcessor(Mock())
+        spans = [Mock(), Mock(), Mock()]
+        
+        with SpanBuffer("test-trace", max_queue_size=2) as buffer:
+            for span in spans:
+                processor.on_end(span)
+        
+        assert buffer.get_span_count() == 2
+        assert buffer.get_all_spans() == spans[1:]
+        assert buffer.get_dropped_count() == 1
+    
+    def test_get_span_count(self):
+        """Test getting span count"""
+        buffer = SpanBuffer("test-trace")
+        
+        assert buffer.get_span_count() == 0
+        
+        buffer._local_queue.extend([Mock(), Mock()])
+        assert buffer.get_span_count() == 2
+
+
+class TestIntegration:
+    """Integration tests with RespanClient"""
+    
+    def test_client_get_span_buffer(self, telemetry):
+        """Test getting span buffer from client"""
+        client = get_client()
+        
+        # Get span buffer
+        buffer = client.get_span_buffer("test-trace")
+        
+        # Verify
+        assert isinstance(buffer, SpanBuffer)
+        assert buffer.trace_id == "test-trace"
+    
+    def test_span_buffer_isolation(self, telemetry):
+        """Test that span buffer collects ALL spans within its context"""
+        client = get_client()
+        tracer = client.get_tracer()
+        
+        # Create normal span BEFORE buffer (should NOT be buffered)
+        with tracer.start_as_current_span("span_before_buffer") as span:
+            span.set_attribute("type", "before")
+        
+        # Create span buffer
+        with client.get_span_buffer("test-trace") as buffer:
+            # Create spans in buffer
+            buffer.create_span("buffered_span", {"type": "buffered"})
+            
+            # Create normal span WITHIN buffer context (WILL be buffered)
+            with tracer.start_as_current_span("span_within_buffer") as span:
+                span.set_attribute("type", "within")
+            
+            # Both spans should be in queue (all spans within context are buffered)
+            assert buffer.get_span_count() == 2
+            span_names = [s.name for s in buffer.get_all_spans()]
+            assert "buffered_span" in span_names
+            assert "span_within_buffer" in span_names
+        
+        # Create normal span AFTER buffer (should NOT be buffered)
+        with tracer.start_as_current_span("span_after_buffer") as span:
+            span.set_attribute("type", "after")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
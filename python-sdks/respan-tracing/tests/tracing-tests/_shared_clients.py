@@ -0,0 +1,19 @@
+"""
+LLM clients shared by the tracing test scripts.
+
+The scripts are run by hand, one per process - pytest skips this directory
+via collect_ignore_glob in tests/conftest.py. Importing one module-level
+client gives every call in a script the same pool of keep-alive
+connections, tuned here once instead of in each script.
+
+Import this module after load_dotenv() so the client sees the API key.
+"""
+
+import httpx
+from openai import OpenAI
+
+OPENAI = OpenAI(
+    http_client=httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+    )
+)
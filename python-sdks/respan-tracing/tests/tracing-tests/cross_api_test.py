@@ -5,12 +5,18 @@ load_dotenv("tests/.env", override=True)
 Call an endpoint and check if the telemetry headers are included in the request
 """
 
+import atexit
+
 from respan_tracing import RespanTelemetry, workflow
-from requests import post
+from requests import Session
 
 k_tl = RespanTelemetry(
 )
 
+# One pooled session for all webhook calls so each topic reuses the connection
+SESSION = Session()
+atexit.register(SESSION.close)
+
 
 topics = ["black hole"]
 prompt_template = """
@@ -28,7 +34,7 @@ Question: {question}
 def send_webhook(topic):
     prompt = prompt_template.format(question=topic)
 
-    response = post(
+    response = SESSION.post(
         url="https://webhook.site/5d2f431e-1ed6-4639-bd6c-dc19de391a50",
         json={"prompt": prompt},
     )
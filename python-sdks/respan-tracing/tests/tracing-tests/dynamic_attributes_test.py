@@ -2,13 +2,12 @@ from dotenv import load_dotenv
 load_dotenv(override=True)
 
 from respan_tracing.contexts.span import respan_span_attributes
-from openai import OpenAI
+from _shared_clients import OPENAI as client
 from respan_tracing import RespanTelemetry
 from respan_tracing.decorators import workflow, task
 import os
 
 k_tl = RespanTelemetry()
-client = OpenAI()
 
 os.environ["RESPAN_API_KEY"] = "test"
 os.environ["RESPAN_BASE_URL"] = "https://api.respan.ai/api"
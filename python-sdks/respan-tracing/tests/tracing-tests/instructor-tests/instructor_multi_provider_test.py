@@ -6,13 +6,21 @@ This test shows how Respan tracing works with:
 - Anthropic Claude models
 - Different model capabilities and structured outputs
 - Provider-specific features and parameters
+- Concurrent async calls to both providers
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+from pathlib import Path
 from dotenv import load_dotenv
 import os
-from typing import List, Optional, Literal
+import sys
+from typing import List, Optional, Literal, Type
 from pydantic import BaseModel, Field
-import instructor
 from respan_tracing import RespanTelemetry
 from respan_tracing.decorators import task, workflow
 
@@ -22,11 +30,28 @@ load_dotenv(".env", override=True)
 # Initialize Respan Telemetry
 k_tl = RespanTelemetry(app_name="instructor-multi-provider-test")
 
+_JSON_SCHEMA_CACHE = {}
+
+class CachedSchemaModel(BaseModel):
+    """BaseModel whose default JSON schema is generated once per class.
+
+    Instructor asks the response model for its schema on every call; calls with
+    non-default arguments still go through Pydantic.
+    """
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs):
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        if cls not in _JSON_SCHEMA_CACHE:
+            _JSON_SCHEMA_CACHE[cls] = super().model_json_schema()
+        return copy.deepcopy(_JSON_SCHEMA_CACHE[cls])
+
 # Define shared Pydantic models
 class Sentiment(str, Literal["positive", "negative", "neutral"]):
     pass
 
-class TextAnalysis(BaseModel):
+class TextAnalysis(CachedSchemaModel):
     """Analysis of a text with sentiment and key points."""
     text: str = Field(description="The original text being analyzed")
     sentiment: Sentiment = Field(description="Overall sentiment of the text")
@@ -34,7 +59,7 @@ class TextAnalysis(BaseModel):
     key_points: List[str] = Field(description="Key points or themes", min_length=1, max_length=5)
     summary: str = Field(description="Brief summary of the text", max_length=200)
 
-class CodeExplanation(BaseModel):
+class CodeExplanation(CachedSchemaModel):
     """Explanation of code functionality."""
     language: str = Field(description="Programming language")
     purpose: str = Field(description="What the code does")
@@ -42,7 +67,7 @@ class CodeExplanation(BaseModel):
     key_concepts: List[str] = Field(description="Key programming concepts used")
     explanation: str = Field(description="Detailed explanation of the code")
 
-class CreativeStory(BaseModel):
+class CreativeStory(CachedSchemaModel):
     """A creative story with structured elements."""
     title: str = Field(description="Story title")
     genre: str = Field(description="Story genre")
@@ -51,25 +76,89 @@ class CreativeStory(BaseModel):
     plot_summary: str = Field(description="Brief plot summary")
     story: str = Field(description="The full story", min_length=100)
 
-# Initialize clients for different providers
-openai_client = instructor.from_provider("openai/gpt-4o-mini")
+# System prompts shared by both providers' tasks. Keeping each one an identical
+# prefix across calls lets OpenAI's automatic prompt caching reuse it.
+_SYSTEM_ANALYSIS = "Analyze the sentiment and key points of the provided text. Be thorough and accurate."
+_SYSTEM_CODE = "Explain the provided code in detail. Identify the language, purpose, complexity, and key concepts."
+_SYSTEM_STORY = "Create an engaging short story based on the prompt. Include all required story elements."
+
+# Opt-in exact-match response cache (INSTRUCTOR_RESPONSE_CACHE=1). Off by default
+# because a cache hit skips the LLM call, so no LLM span is traced for it.
+RESPONSE_CACHE_ENABLED = os.getenv("INSTRUCTOR_RESPONSE_CACHE") == "1"
+RESPONSE_CACHE_DIR = Path(os.getenv("INSTRUCTOR_RESPONSE_CACHE_DIR", ".llm_cache"))
+
+def cached_response(response_model: Type[BaseModel]):
+    """Cache a provider task's structured result on disk, keyed by its inputs.
+
+    The key covers the task's source (model, user prompt, temperature, max_tokens),
+    the shared system prompts, its arguments and the response model's JSON
+    schema, so editing any of them
+    invalidates the entry. Apply it below @task so the task span is still recorded.
+    """
+    schema = json.dumps(response_model.model_json_schema(), sort_keys=True)
+
+    def decorator(func):
+        source = "\n".join(
+            [inspect.getsource(func), _SYSTEM_ANALYSIS, _SYSTEM_CODE, _SYSTEM_STORY]
+        )
+        source_hash = hashlib.sha256(source.encode()).hexdigest()
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            if not RESPONSE_CACHE_ENABLED:
+                return await func(*args)
+
+            key = hashlib.sha256(
+                json.dumps({"source": source_hash, "args": args, "schema": schema}).encode()
+            ).hexdigest()
+            cache_file = RESPONSE_CACHE_DIR / f"{key}.json"
+            if cache_file.exists():
+                return response_model.model_validate_json(cache_file.read_text())
+
+            result = await func(*args)
+            if result is not None:
+                RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(result.model_dump_json())
+            return result
+
+        return wrapper
+
+    return decorator
+
+# Provider clients are built on first use so importing this module (e.g. during
+# pytest collection) does not pay for importing instructor and the provider SDKs
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """Async Instructor client for OpenAI, so calls can run concurrently."""
+    import instructor
+
+    return instructor.from_provider("openai/gpt-4o-mini", async_client=True)
+
+@functools.lru_cache(maxsize=1)
+def _get_anthropic_client():
+    """Async Instructor client for Anthropic, or None if it is not available."""
+    import instructor
+
+    try:
+        return instructor.from_provider(
+            "anthropic/claude-3-5-haiku-20241022", async_client=True
+        )
+    except Exception as e:
+        print(f"⚠️ Anthropic not available: {e}")
+        return None
 
-# Check if Anthropic is available
-try:
-    anthropic_client = instructor.from_provider("anthropic/claude-3-5-haiku-20241022")
-    ANTHROPIC_AVAILABLE = True
-except Exception as e:
-    print(f"⚠️ Anthropic not available: {e}")
-    anthropic_client = None
-    ANTHROPIC_AVAILABLE = False
+def anthropic_available() -> bool:
+    """Whether an Anthropic client could be created."""
+    return _get_anthropic_client() is not None
 
 @task(name="openai_text_analysis")
-def analyze_text_with_openai(text: str) -> TextAnalysis:
+@cached_response(TextAnalysis)
+async def analyze_text_with_openai(text: str) -> TextAnalysis:
     """Analyze text sentiment using OpenAI."""
-    analysis = openai_client.chat.completions.create(
+    analysis = await _get_openai_client().chat.completions.create(
         response_model=TextAnalysis,
         messages=[
-            {"role": "system", "content": "Analyze the sentiment and key points of the provided text. Be thorough and accurate."},
+            {"role": "system", "content": _SYSTEM_ANALYSIS},
             {"role": "user", "content": text}
         ],
         temperature=0.1,
@@ -78,16 +167,17 @@ def analyze_text_with_openai(text: str) -> TextAnalysis:
     return analysis
 
 @task(name="anthropic_text_analysis")
-def analyze_text_with_anthropic(text: str) -> Optional[TextAnalysis]:
+@cached_response(TextAnalysis)
+async def analyze_text_with_anthropic(text: str) -> Optional[TextAnalysis]:
     """Analyze text sentiment using Anthropic Claude."""
-    if not ANTHROPIC_AVAILABLE:
+    if not anthropic_available():
         print("⚠️ Skipping Anthropic test - not available")
         return None
     
-    analysis = anthropic_client.chat.completions.create(
+    analysis = await _get_anthropic_client().chat.completions.create(
         response_model=TextAnalysis,
         messages=[
-            {"role": "system", "content": "Analyze the sentiment and key points of the provided text. Be thorough and accurate."},
+            {"role": "system", "content": _SYSTEM_ANALYSIS},
             {"role": "user", "content": text}
         ],
         temperature=0.1,
@@ -96,12 +186,13 @@ def analyze_text_with_anthropic(text: str) -> Optional[TextAnalysis]:
     return analysis
 
 @task(name="openai_code_explanation")
-def explain_code_with_openai(code: str) -> CodeExplanation:
+@cached_response(CodeExplanation)
+async def explain_code_with_openai(code: str) -> CodeExplanation:
     """Explain code using OpenAI."""
-    explanation = openai_client.chat.completions.create(
+    explanation = await _get_openai_client().chat.completions.create(
         response_model=CodeExplanation,
         messages=[
-            {"role": "system", "content": "Explain the provided code in detail. Identify the language, purpose, complexity, and key concepts."},
+            {"role": "system", "content": _SYSTEM_CODE},
             {"role": "user", "content": f"Explain this code:\n\n{code}"}
         ],
         temperature=0.2,
@@ -110,16 +201,17 @@ def explain_code_with_openai(code: str) -> CodeExplanation:
     return explanation
 
 @task(name="anthropic_code_explanation")
-def explain_code_with_anthropic(code: str) -> Optional[CodeExplanation]:
+@cached_response(CodeExplanation)
+async def explain_code_with_anthropic(code: str) -> Optional[CodeExplanation]:
     """Explain code using Anthropic Claude."""
-    if not ANTHROPIC_AVAILABLE:
+    if not anthropic_available():
         print("⚠️ Skipping Anthropic test - not available")
         return None
     
-    explanation = anthropic_client.chat.completions.create(
+    explanation = await _get_anthropic_client().chat.completions.create(
         response_model=CodeExplanation,
         messages=[
-            {"role": "system", "content": "Explain the provided code in detail. Identify the language, purpose, complexity, and key concepts."},
+            {"role": "system", "content": _SYSTEM_CODE},
             {"role": "user", "content": f"Explain this code:\n\n{code}"}
         ],
         temperature=0.2,
@@ -128,12 +220,13 @@ def explain_code_with_anthropic(code: str) -> Optional[CodeExplanation]:
     return explanation
 
 @task(name="openai_creative_writing")
-def create_story_with_openai(prompt: str) -> CreativeStory:
+@cached_response(CreativeStory)
+async def create_story_with_openai(prompt: str) -> CreativeStory:
     """Create a creative story using OpenAI."""
-    story = openai_client.chat.completions.create(
+    story = await _get_openai_client().chat.completions.create(
         response_model=CreativeStory,
         messages=[
-            {"role": "system", "content": "Create an engaging short story based on the prompt. Include all required story elements."},
+            {"role": "system", "content": _SYSTEM_STORY},
             {"role": "user", "content": prompt}
         ],
         temperature=0.7,  # Higher temperature for creativity
@@ -142,16 +235,17 @@ def create_story_with_openai(prompt: str) -> CreativeStory:
     return story
 
 @task(name="anthropic_creative_writing")
-def create_story_with_anthropic(prompt: str) -> Optional[CreativeStory]:
+@cached_response(CreativeStory)
+async def create_story_with_anthropic(prompt: str) -> Optional[CreativeStory]:
     """Create a creative story using Anthropic Claude."""
-    if not ANTHROPIC_AVAILABLE:
+    if not anthropic_available():
         print("⚠️ Skipping Anthropic test - not available")
         return None
     
-    story = anthropic_client.chat.completions.create(
+    story = await _get_anthropic_client().chat.completions.create(
         response_model=CreativeStory,
         messages=[
-            {"role": "system", "content": "Create an engaging short story based on the prompt. Include all required story elements."},
+            {"role": "system", "content": _SYSTEM_STORY},
             {"role": "user", "content": prompt}
         ],
         temperature=0.7,  # Higher temperature for creativity
@@ -159,33 +253,61 @@ def create_story_with_anthropic(prompt: str) -> Optional[CreativeStory]:
     )
     return story
 
+async def _run_phase(key: str, openai_call, anthropic_call):
+    """Await one comparison's pair of provider calls concurrently."""
+    openai_result, anthropic_result = await asyncio.gather(openai_call, anthropic_call)
+    return key, openai_result, anthropic_result
+
+def _report_text_analysis(openai_analysis, anthropic_analysis) -> List[str]:
+    lines = ["\n=== Test 1: Text Analysis Comparison ==="]
+    lines.append(f"   OpenAI Sentiment: {openai_analysis.sentiment} (confidence: {openai_analysis.confidence:.2f})")
+    lines.append(f"   OpenAI Key Points: {', '.join(openai_analysis.key_points)}")
+    
+    if anthropic_analysis:
+        lines.append(f"   Anthropic Sentiment: {anthropic_analysis.sentiment} (confidence: {anthropic_analysis.confidence:.2f})")
+        lines.append(f"   Anthropic Key Points: {', '.join(anthropic_analysis.key_points)}")
+    return lines
+
+def _report_code_explanation(openai_code, anthropic_code) -> List[str]:
+    lines = ["\n=== Test 2: Code Explanation Comparison ==="]
+    lines.append(f"   OpenAI Language: {openai_code.language}")
+    lines.append(f"   OpenAI Complexity: {openai_code.complexity}")
+    lines.append(f"   OpenAI Purpose: {openai_code.purpose}")
+    
+    if anthropic_code:
+        lines.append(f"   Anthropic Language: {anthropic_code.language}")
+        lines.append(f"   Anthropic Complexity: {anthropic_code.complexity}")
+        lines.append(f"   Anthropic Purpose: {anthropic_code.purpose}")
+    return lines
+
+def _report_creative_writing(openai_story, anthropic_story) -> List[str]:
+    lines = ["\n=== Test 3: Creative Writing Comparison ==="]
+    lines.append(f"   OpenAI Story: '{openai_story.title}' ({openai_story.genre})")
+    lines.append(f"   OpenAI Character: {openai_story.main_character}")
+    lines.append(f"   OpenAI Setting: {openai_story.setting}")
+    
+    if anthropic_story:
+        lines.append(f"   Anthropic Story: '{anthropic_story.title}' ({anthropic_story.genre})")
+        lines.append(f"   Anthropic Character: {anthropic_story.main_character}")
+        lines.append(f"   Anthropic Setting: {anthropic_story.setting}")
+    return lines
+
+PHASE_REPORTERS = {
+    "text_analysis": _report_text_analysis,
+    "code_explanation": _report_code_explanation,
+    "creative_writing": _report_creative_writing,
+}
+
 @workflow(name="multi_provider_comparison")
-def run_multi_provider_tests():
+async def run_multi_provider_tests():
     """Run the same tasks across different providers for comparison."""
     
-    # Test 1: Text Analysis Comparison
-    print("\n=== Test 1: Text Analysis Comparison ===")
     sample_text = """
     I absolutely love the new features in this software update! The user interface is so much more 
     intuitive and the performance improvements are incredible. However, I'm a bit concerned about 
     the learning curve for some of the advanced features. Overall, this is a fantastic update that 
     will really help our team be more productive.
     """
-    
-    print("📝 Analyzing text with OpenAI...")
-    openai_analysis = analyze_text_with_openai(sample_text)
-    print(f"   OpenAI Sentiment: {openai_analysis.sentiment} (confidence: {openai_analysis.confidence:.2f})")
-    print(f"   OpenAI Key Points: {', '.join(openai_analysis.key_points)}")
-    
-    anthropic_analysis = None
-    if ANTHROPIC_AVAILABLE:
-        print("📝 Analyzing text with Anthropic...")
-        anthropic_analysis = analyze_text_with_anthropic(sample_text)
-        print(f"   Anthropic Sentiment: {anthropic_analysis.sentiment} (confidence: {anthropic_analysis.confidence:.2f})")
-        print(f"   Anthropic Key Points: {', '.join(anthropic_analysis.key_points)}")
-    
-    # Test 2: Code Explanation Comparison
-    print("\n=== Test 2: Code Explanation Comparison ===")
     sample_code = """
     def fibonacci(n):
         if n <= 1:
@@ -197,98 +319,71 @@ def run_multi_provider_tests():
     for i in range(10):
         print(f"F({i}) = {fibonacci(i)}")
     """
-    
-    print("💻 Explaining code with OpenAI...")
-    openai_code = explain_code_with_openai(sample_code)
-    print(f"   OpenAI Language: {openai_code.language}")
-    print(f"   OpenAI Complexity: {openai_code.complexity}")
-    print(f"   OpenAI Purpose: {openai_code.purpose}")
-    
-    anthropic_code = None
-    if ANTHROPIC_AVAILABLE:
-        print("💻 Explaining code with Anthropic...")
-        anthropic_code = explain_code_with_anthropic(sample_code)
-        print(f"   Anthropic Language: {anthropic_code.language}")
-        print(f"   Anthropic Complexity: {anthropic_code.complexity}")
-        print(f"   Anthropic Purpose: {anthropic_code.purpose}")
-    
-    # Test 3: Creative Writing Comparison
-    print("\n=== Test 3: Creative Writing Comparison ===")
     story_prompt = "Write a short story about a robot who discovers they can dream."
     
-    print("✨ Creating story with OpenAI...")
-    openai_story = create_story_with_openai(story_prompt)
-    print(f"   OpenAI Story: '{openai_story.title}' ({openai_story.genre})")
-    print(f"   OpenAI Character: {openai_story.main_character}")
-    print(f"   OpenAI Setting: {openai_story.setting}")
+    # The three comparisons are independent, so all six provider calls run at
+    # once and each comparison is reported as soon as both of its results arrive
+    print("\n🚀 Running text analysis, code explanation and creative writing on both providers...")
+    phases = [
+        _run_phase("text_analysis", analyze_text_with_openai(sample_text), analyze_text_with_anthropic(sample_text)),
+        _run_phase("code_explanation", explain_code_with_openai(sample_code), explain_code_with_anthropic(sample_code)),
+        _run_phase("creative_writing", create_story_with_openai(story_prompt), create_story_with_anthropic(story_prompt)),
+    ]
     
-    anthropic_story = None
-    if ANTHROPIC_AVAILABLE:
-        print("✨ Creating story with Anthropic...")
-        anthropic_story = create_story_with_anthropic(story_prompt)
-        print(f"   Anthropic Story: '{anthropic_story.title}' ({anthropic_story.genre})")
-        print(f"   Anthropic Character: {anthropic_story.main_character}")
-        print(f"   Anthropic Setting: {anthropic_story.setting}")
+    results = {}
+    for phase in asyncio.as_completed(phases):
+        key, openai_result, anthropic_result = await phase
+        sys.stdout.write("\n".join(PHASE_REPORTERS[key](openai_result, anthropic_result)) + "\n")
+        results[key] = {"openai": openai_result, "anthropic": anthropic_result}
     
-    return {
-        "text_analysis": {
-            "openai": openai_analysis,
-            "anthropic": anthropic_analysis
-        },
-        "code_explanation": {
-            "openai": openai_code,
-            "anthropic": anthropic_code
-        },
-        "creative_writing": {
-            "openai": openai_story,
-            "anthropic": anthropic_story
-        }
-    }
+    return results
 
 @task(name="compare_provider_results")
 def compare_provider_results(results: dict):
     """Compare results from different providers."""
-    print("\n=== Provider Comparison Summary ===")
+    lines = []
+    lines.append("\n=== Provider Comparison Summary ===")
     
     # Compare text analysis
     openai_analysis = results["text_analysis"]["openai"]
     anthropic_analysis = results["text_analysis"]["anthropic"]
     
-    print(f"📊 Text Analysis:")
-    print(f"   OpenAI Sentiment: {openai_analysis.sentiment}")
+    lines.append(f"📊 Text Analysis:")
+    lines.append(f"   OpenAI Sentiment: {openai_analysis.sentiment}")
     if anthropic_analysis:
-        print(f"   Anthropic Sentiment: {anthropic_analysis.sentiment}")
+        lines.append(f"   Anthropic Sentiment: {anthropic_analysis.sentiment}")
         sentiment_match = openai_analysis.sentiment == anthropic_analysis.sentiment
-        print(f"   Sentiment Agreement: {'✅' if sentiment_match else '❌'}")
+        lines.append(f"   Sentiment Agreement: {'✅' if sentiment_match else '❌'}")
     
     # Compare code explanations
     openai_code = results["code_explanation"]["openai"]
     anthropic_code = results["code_explanation"]["anthropic"]
     
-    print(f"\n💻 Code Explanation:")
-    print(f"   OpenAI Language: {openai_code.language}")
+    lines.append(f"\n💻 Code Explanation:")
+    lines.append(f"   OpenAI Language: {openai_code.language}")
     if anthropic_code:
-        print(f"   Anthropic Language: {anthropic_code.language}")
+        lines.append(f"   Anthropic Language: {anthropic_code.language}")
         language_match = openai_code.language.lower() == anthropic_code.language.lower()
-        print(f"   Language Agreement: {'✅' if language_match else '❌'}")
+        lines.append(f"   Language Agreement: {'✅' if language_match else '❌'}")
     
     # Compare creative outputs
     openai_story = results["creative_writing"]["openai"]
     anthropic_story = results["creative_writing"]["anthropic"]
     
-    print(f"\n✨ Creative Writing:")
-    print(f"   OpenAI Genre: {openai_story.genre}")
+    lines.append(f"\n✨ Creative Writing:")
+    lines.append(f"   OpenAI Genre: {openai_story.genre}")
     if anthropic_story:
-        print(f"   Anthropic Genre: {anthropic_story.genre}")
+        lines.append(f"   Anthropic Genre: {anthropic_story.genre}")
     
-    print(f"\n🎯 Provider Availability:")
-    print(f"   OpenAI: ✅ Available")
-    print(f"   Anthropic: {'✅ Available' if ANTHROPIC_AVAILABLE else '❌ Not Available'}")
+    lines.append(f"\n🎯 Provider Availability:")
+    lines.append(f"   OpenAI: ✅ Available")
+    lines.append(f"   Anthropic: {'✅ Available' if anthropic_available() else '❌ Not Available'}")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return True
 
 @workflow(name="instructor_multi_provider_demo")
-def main():
+async def main():
     """Main workflow demonstrating Instructor with multiple providers."""
     print("🚀 Starting Multi-Provider Instructor + Respan Tracing Demo")
     print("=" * 65)
@@ -296,37 +391,45 @@ def main():
     # Check provider availability
     print(f"🔍 Provider Status:")
     print(f"   OpenAI: ✅ Available")
-    print(f"   Anthropic: {'✅ Available' if ANTHROPIC_AVAILABLE else '❌ Not Available (check API key)'}")
+    print(f"   Anthropic: {'✅ Available' if anthropic_available() else '❌ Not Available (check API key)'}")
     
-    if not ANTHROPIC_AVAILABLE:
+    if not anthropic_available():
         print("\n⚠️ Note: Some tests will be skipped due to missing Anthropic configuration")
     
     # Run multi-provider tests
-    results = run_multi_provider_tests()
+    results = await run_multi_provider_tests()
     
     # Compare results
     comparison_done = compare_provider_results(results)
     
-    print("\n" + "=" * 65)
-    print("✅ Multi-provider demo completed successfully!")
-    print(f"✅ Comparison completed: {comparison_done}")
-    print("\n🌟 Features demonstrated:")
-    print("   ✅ OpenAI GPT-4o-mini structured outputs")
-    if ANTHROPIC_AVAILABLE:
-        print("   ✅ Anthropic Claude structured outputs")
+    lines = []
+    lines.append("\n" + "=" * 65)
+    lines.append("✅ Multi-provider demo completed successfully!")
+    lines.append(f"✅ Comparison completed: {comparison_done}")
+    lines.append("\n🌟 Features demonstrated:")
+    lines.append("   ✅ OpenAI GPT-4o-mini structured outputs")
+    if anthropic_available():
+        lines.append("   ✅ Anthropic Claude structured outputs")
     else:
-        print("   ⚠️ Anthropic Claude (skipped - not configured)")
-    print("   ✅ Provider-specific parameter handling")
-    print("   ✅ Cross-provider result comparison")
-    print("   ✅ Unified tracing across providers")
-    print("\n📈 Check your Respan dashboard for:")
-    print("   - Separate traces for each provider")
-    print("   - Token usage comparison")
-    print("   - Response time differences")
-    print("   - Model-specific parameters")
-    print("   - Provider-specific metadata")
+        lines.append("   ⚠️ Anthropic Claude (skipped - not configured)")
+    lines.append("   ✅ Provider-specific parameter handling")
+    lines.append("   ✅ Cross-provider result comparison")
+    lines.append("   ✅ Unified tracing across providers")
+    lines.append("\n📈 Check your Respan dashboard for:")
+    lines.append("   - Separate traces for each provider")
+    lines.append("   - Token usage comparison")
+    lines.append("   - Response time differences")
+    lines.append("   - Model-specific parameters")
+    lines.append("   - Provider-specific metadata")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # uvloop is optional; it only lowers event-loop overhead for the concurrent calls
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
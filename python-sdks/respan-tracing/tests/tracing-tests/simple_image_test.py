@@ -1,23 +1,26 @@
-import time
+import os
 import json
 from dotenv import load_dotenv
 
 load_dotenv(".env", override=True)
 
+# Export through the batch processor with a short schedule delay so spans are
+# shipped off the traced code path instead of synchronously on every span end
+os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", "200")
+os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "512")
+
 from respan_tracing.decorators.base import R
 from respan_tracing.main import RespanTelemetry
 from respan_tracing.decorators import task
-from openai import OpenAI
+from _shared_clients import OPENAI as client
 
 # Initialize telemetry
 telemetry = RespanTelemetry(
     app_name="products-tests",
     log_level="DEBUG",
-    is_batching_enabled=False,
+    is_batching_enabled=True,
 )
 
-client = OpenAI()
-
 
 @task(name="image_analysis")
 def image_analysis(prompt: str, image_url: str):
@@ -48,9 +51,9 @@ def main():
         "https://media.istockphoto.com/id/184276818/photo/red-apple.jpg?s=612x612&w=0&k=20&c=NvO-bLsG0DJ_7Ii8SSVoKLurzjmV0Qi4eGfn6nW3l5w=",
     )
 
-    # Allow exporter to run and show debug output
+    # Block until the batch processor has exported the spans (shows debug output)
     print("⏳ Waiting for telemetry export...")
-    time.sleep(0.2)
+    telemetry.flush(timeout_millis=5000)
 
     print("✨ Check the output above for debug export preview!")
     print("   Look for lines containing:")
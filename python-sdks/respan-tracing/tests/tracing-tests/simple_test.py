@@ -11,10 +11,9 @@ print(os.environ["RESPAN_API_KEY"])
 k_tl = RespanTelemetry()
 # endregion: setup
 import time
-from openai import OpenAI
+from _shared_clients import OPENAI as client
 from respan_tracing.decorators import task
 
-client = OpenAI()
 
 @task(name="joke_creation")
 def create_joke(joke_requirement: str):
@@ -26,7 +25,6 @@ def create_joke(joke_requirement: str):
         frequency_penalty=0.5,
         presence_penalty=0.5,
         stop=["\n"],
-        logprobs=True,
     )
     joke = completion.choices[0].message.content
 
@@ -17,7 +17,11 @@ Remember, keep it ENGAGING and FUN!
 Question: {question}
 """
 from time import sleep
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+
+# Reused worker threads; the threading instrumentation propagates the OTel
+# context into submitted tasks, so no manual context copying is needed
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
 
 
 @task(name="another_generation")
@@ -29,8 +33,7 @@ def another_generation(prompt):
 @workflow(name="explain_concept")
 def explain_concept(topic):
     prompt = prompt_template.format(question=topic)
-    thread = Thread(target=another_generation, args=(prompt,))
-    thread.start()
+    future = _EXECUTOR.submit(another_generation, prompt)
     # another_generation(prompt)
     response = (
         openai.chat.completions.create(
@@ -47,9 +50,9 @@ def explain_concept(topic):
         .message.content
     )
 
-    # IMPORTANT FIX: Wait for the background thread to complete
+    # IMPORTANT FIX: Wait for the background task to complete
     # This ensures the span gets properly closed and exported
-    thread.join()
+    future.result()
 
     return response
 
@@ -35,6 +35,19 @@ from respan import (
     RunExperimentEvalsRequest,
 )
 
+# Shared settings, built once and reused by every column below. Pydantic
+# copies container values on validation, so the columns never share state.
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+COLUMN_DEFAULTS = {
+    "top_p": 1.0,
+    "frequency_penalty": 0.0,
+    "presence_penalty": 0.0,
+    "tools": [],
+    "tool_choice": "auto",
+    "response_format": {"type": "text"},
+}
+QUESTION_MESSAGE = {"role": "user", "content": "{{question}}"}
+
 
 async def main():
     """Main workflow demonstration"""
@@ -50,7 +63,7 @@ async def main():
     print("✅ Experiment API client initialized")
     
     # Generate unique experiment name
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
     experiment_name = f"SDK_Example_Experiment_{timestamp}"
     
     try:
@@ -64,22 +77,14 @@ async def main():
             name="Helpful Assistant",
             temperature=0.7,
             max_completion_tokens=200,
-            top_p=1.0,
-            frequency_penalty=0.0,
-            presence_penalty=0.0,
             prompt_messages=[
                 {
                     "role": "system",
                     "content": "You are a helpful assistant. Answer questions clearly and concisely."
                 },
-                {
-                    "role": "user",
-                    "content": "{{question}}"
-                }
+                QUESTION_MESSAGE,
             ],
-            tools=[],
-            tool_choice="auto",
-            response_format={"type": "text"}
+            **COLUMN_DEFAULTS,
         )
         
         initial_row = ExperimentRowType(
@@ -127,22 +132,14 @@ async def main():
             name="Expert Assistant",
             temperature=0.3,  # Lower temperature for more focused responses
             max_completion_tokens=250,
-            top_p=1.0,
-            frequency_penalty=0.0,
-            presence_penalty=0.0,
             prompt_messages=[
                 {
                     "role": "system",
                     "content": "You are an expert technical assistant. Provide accurate, detailed explanations."
                 },
-                {
-                    "role": "user",
-                    "content": "{{question}}"
-                }
+                QUESTION_MESSAGE,
             ],
-            tools=[],
-            tool_choice="auto",
-            response_format={"type": "text"}
+            **COLUMN_DEFAULTS,
         )
         
         add_columns_request = AddExperimentColumnsRequest(columns=[new_column])
@@ -163,7 +160,12 @@ async def main():
         # Step 5: Check the updated experiment
         print("\n🔍 Step 5: Checking experiment status...")
         
-        final_experiment = await client.aget(experiment.id)
+        # The experiment list shown in Step 8 is read-only and independent of this
+        # lookup, so both requests are sent concurrently over the pooled client
+        final_experiment, experiments = await asyncio.gather(
+            client.aget(experiment.id),
+            client.alist(page_size=5),
+        )
         print(f"📊 Experiment now has:")
         print(f"   - {len(final_experiment.columns)} columns (model configurations)")
         print(f"   - {len(final_experiment.rows)} rows (test cases)")
@@ -196,7 +198,6 @@ async def main():
         # Step 8: List all experiments
         print("\n📋 Step 8: Listing experiments...")
         
-        experiments = await client.alist(page_size=5)
         print(f"📊 Found {experiments.total} total experiments")
         print("Recent experiments:")
         for exp in experiments.experiments[:3]:
@@ -216,7 +217,9 @@ async def main():
         # print(f"\n🧹 Cleaning up test experiment...")
         # await client.adelete(experiment.id)
         # print("✅ Test experiment deleted")
-        pass
+
+        # Release the pooled connections shared by all the steps above
+        await client.aclose()
 
 
 def sync_example():
@@ -233,23 +236,18 @@ def sync_example():
     client = ExperimentAPI(api_key=api_key, base_url=base_url)
     
     # Simple synchronous workflow
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
     
     column = ExperimentColumnType(
         model="gpt-3.5-turbo",
         name="Sync Test Column",
         temperature=0.5,
         max_completion_tokens=150,
-        top_p=1.0,
-        frequency_penalty=0.0,
-        presence_penalty=0.0,
         prompt_messages=[
             {"role": "system", "content": "You are a helpful assistant."},
             {"role": "user", "content": "{{input}}"}
         ],
-        tools=[],
-        tool_choice="auto",
-        response_format={"type": "text"}
+        **COLUMN_DEFAULTS,
     )
     
     row = ExperimentRowType(
@@ -281,6 +279,9 @@ def sync_example():
     except Exception as e:
         print(f"❌ Sync error: {e}")
 
+    finally:
+        client.close()
+
 
 if __name__ == "__main__":
     print("🚀 Respan Experiment API Example")
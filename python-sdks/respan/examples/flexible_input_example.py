@@ -162,6 +162,16 @@ async def main():
     except Exception as e:
         print(f"✗ Error: {e}")
     
+    # Option 3: Many logs at once, buffered and sent concurrently in the background
+    print("\n3. Creating many logs with a batch collector:")
+    try:
+        async with log_client.batch(max_items=50) as batch:
+            for i in range(5):
+                await batch.add({**log_dict, "custom_identifier": f"ml_qa_batch_{i:03d}"})
+        print(f"✓ Created batched logs ({len(batch.errors)} failed)")
+    except Exception as e:
+        print(f"✗ Error: {e}")
+    
     print("\n=== SYNCHRONOUS USAGE (Same Flexibility) ===\n")
     
     # All the same flexibility works with synchronous methods too
@@ -18,6 +18,7 @@ existing values for fields you don't want to change.
 import os
 import asyncio
 from respan.prompts.api import PromptAPI
+from respan.types.prompt_types import PromptVersion
 
 
 async def main():
@@ -47,6 +48,10 @@ async def main():
         print(f"   {key}: {value}")
     print()
     
+    # The PATCH body holds only the fields that were set, like this dump
+    request_body = PromptVersion.model_validate(partial_update).model_dump(exclude_unset=True)
+    print(f"📦 Request body: {request_body}\n")
+    
     try:
         # This will now only send the 3 fields above to the server
         # Other fields like model, stream, top_p, etc. remain unchanged
@@ -60,11 +65,13 @@ async def main():
         # )
         # print(f"✅ Updated version {updated_version.version}")
         
-        print("✅ Success! Only 3 fields sent to server (not 13+)")
+        print(f"✅ Success! Only {len(request_body)} fields sent to server (not 13+)")
         print("✅ Existing values for other fields preserved")
         
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        await client.aclose()
     
     print("\n💡 Key Benefits:")
     print("   • No unintended overwrites with default values")
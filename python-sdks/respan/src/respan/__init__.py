@@ -1,96 +1,114 @@
-from respan.datasets import (
-    DatasetAPI,
-    create_dataset_client,
-    Dataset,
-    DatasetCreate,
-    DatasetUpdate,
-    DatasetList,
-    LogManagementRequest,
-    EvalRunRequest,
-    EvalReport,
-    EvalReportList,
-)
-
-from respan.evaluators import (
-    EvaluatorAPI,
-    create_evaluator_client,
-    Evaluator,
-    EvaluatorList,
-)
-from respan.logs import (
-    LogAPI,
-    create_log_client,
-)
-
-from respan.experiments import (
-    ExperimentAPI,
-    create_experiment_client,
-)
-
-from respan.prompts import (
-    PromptAPI,
-    create_prompt_client,
-)
-
-from respan.types.experiment_types import (
-    Experiment,
-    ExperimentList,
-    ExperimentCreate,
-    ExperimentUpdate,
-    ExperimentColumnType,
-    ExperimentRowType,
-    AddExperimentRowsRequest,
-    RemoveExperimentRowsRequest,
-    UpdateExperimentRowsRequest,
-    AddExperimentColumnsRequest,
-    RemoveExperimentColumnsRequest,
-    UpdateExperimentColumnsRequest,
-    RunExperimentRequest,
-    RunExperimentEvalsRequest,
-)
-
-from respan.types.prompt_types import (
-    Prompt,
-    PromptVersion,
-    PromptCreateResponse,
-    PromptListResponse,
-    PromptRetrieveResponse,
-    PromptVersionCreateResponse,
-    PromptVersionListResponse,
-    PromptVersionRetrieveResponse,
-)
-
-from respan.constants.dataset_constants import (
-    DatasetType,
-    DatasetStatus,
-    DatasetLLMRunStatus,
-    DATASET_TYPE_LLM,
-    DATASET_TYPE_SAMPLING,
-    DATASET_STATUS_INITIALIZING,
-    DATASET_STATUS_READY,
-    DATASET_STATUS_RUNNING,
-    DATASET_STATUS_COMPLETED,
-    DATASET_STATUS_FAILED,
-    DATASET_STATUS_LOADING,
-    DATASET_LLM_RUN_STATUS_PENDING,
-    DATASET_LLM_RUN_STATUS_RUNNING,
-    DATASET_LLM_RUN_STATUS_COMPLETED,
-    DATASET_LLM_RUN_STATUS_FAILED,
-    DATASET_LLM_RUN_STATUS_CANCELLED,
-)
-
-from respan.constants.prompt_constants import (
-    MessageRoleType,
-    ResponseFormatType,
-    ToolChoiceType,
-    ReasoningEffortType,
-    ActivityType,
-    DEFAULT_MODEL,
-    ACTIVITY_TYPE_PROMPT_CREATION,
-    ACTIVITY_TYPE_COMMIT,
-    ACTIVITY_TYPE_UPDATE,
-    ACTIVITY_TYPE_DELETE,
-)
+"""
+Respan API SDK
+
+Public names are resolved lazily on first access (PEP 562), so
+``import respan`` does not load httpx, pydantic or every API module until
+one of them is actually used.
+
+Set ``RESPAN_EAGER_IMPORTS=1`` to load every export at import time instead,
+e.g. to warm a pre-forking server before it forks or to surface import
+errors at startup.
+"""
+
+import importlib
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from respan.datasets import (
+        DatasetAPI,
+        create_dataset_client,
+        Dataset,
+        DatasetCreate,
+        DatasetUpdate,
+        DatasetList,
+        LogManagementRequest,
+        EvalRunRequest,
+        EvalReport,
+        EvalReportList,
+    )
+
+    from respan.evaluators import (
+        EvaluatorAPI,
+        create_evaluator_client,
+        Evaluator,
+        EvaluatorList,
+    )
+    from respan.logs import (
+        LogAPI,
+        LogBatchCollector,
+        create_log_client,
+    )
+
+    from respan.experiments import (
+        ExperimentAPI,
+        create_experiment_client,
+    )
+
+    from respan.prompts import (
+        PromptAPI,
+        create_prompt_client,
+    )
+
+    from respan.types.experiment_types import (
+        Experiment,
+        ExperimentList,
+        ExperimentCreate,
+        ExperimentUpdate,
+        ExperimentColumnType,
+        ExperimentRowType,
+        AddExperimentRowsRequest,
+        RemoveExperimentRowsRequest,
+        UpdateExperimentRowsRequest,
+        AddExperimentColumnsRequest,
+        RemoveExperimentColumnsRequest,
+        UpdateExperimentColumnsRequest,
+        RunExperimentRequest,
+        RunExperimentEvalsRequest,
+    )
+
+    from respan.types.prompt_types import (
+        Prompt,
+        PromptVersion,
+        PromptCreateResponse,
+        PromptListResponse,
+        PromptRetrieveResponse,
+        PromptVersionCreateResponse,
+        PromptVersionListResponse,
+        PromptVersionRetrieveResponse,
+    )
+
+    from respan.constants.dataset_constants import (
+        DatasetType,
+        DatasetStatus,
+        DatasetLLMRunStatus,
+        DATASET_TYPE_LLM,
+        DATASET_TYPE_SAMPLING,
+        DATASET_STATUS_INITIALIZING,
+        DATASET_STATUS_READY,
+        DATASET_STATUS_RUNNING,
+        DATASET_STATUS_COMPLETED,
+        DATASET_STATUS_FAILED,
+        DATASET_STATUS_LOADING,
+        DATASET_LLM_RUN_STATUS_PENDING,
+        DATASET_LLM_RUN_STATUS_RUNNING,
+        DATASET_LLM_RUN_STATUS_COMPLETED,
+        DATASET_LLM_RUN_STATUS_FAILED,
+        DATASET_LLM_RUN_STATUS_CANCELLED,
+    )
+
+    from respan.constants.prompt_constants import (
+        MessageRoleType,
+        ResponseFormatType,
+        ToolChoiceType,
+        ReasoningEffortType,
+        ActivityType,
+        DEFAULT_MODEL,
+        ACTIVITY_TYPE_PROMPT_CREATION,
+        ACTIVITY_TYPE_COMMIT,
+        ACTIVITY_TYPE_UPDATE,
+        ACTIVITY_TYPE_DELETE,
+    )
 
 __version__ = "0.1.0"
 
@@ -103,6 +121,7 @@ __all__ = [
     "create_evaluator_client",
     # Log API
     "LogAPI",
+    "LogBatchCollector",
     "create_log_client",
     # Experiment API
     "ExperimentAPI",
@@ -178,3 +197,117 @@ __all__ = [
     "ACTIVITY_TYPE_UPDATE",
     "ACTIVITY_TYPE_DELETE",
 ]
+
+# Module that defines each lazily exported name
+_LAZY_MODULES = {
+    "respan.datasets": (
+        "DatasetAPI",
+        "create_dataset_client",
+        "Dataset",
+        "DatasetCreate",
+        "DatasetUpdate",
+        "DatasetList",
+        "LogManagementRequest",
+        "EvalRunRequest",
+        "EvalReport",
+        "EvalReportList",
+    ),
+    "respan.evaluators": (
+        "EvaluatorAPI",
+        "create_evaluator_client",
+        "Evaluator",
+        "EvaluatorList",
+    ),
+    "respan.logs": (
+        "LogAPI",
+        "LogBatchCollector",
+        "create_log_client",
+    ),
+    "respan.experiments": (
+        "ExperimentAPI",
+        "create_experiment_client",
+    ),
+    "respan.prompts": (
+        "PromptAPI",
+        "create_prompt_client",
+    ),
+    "respan.types.experiment_types": (
+        "Experiment",
+        "ExperimentList",
+        "ExperimentCreate",
+        "ExperimentUpdate",
+        "ExperimentColumnType",
+        "ExperimentRowType",
+        "AddExperimentRowsRequest",
+        "RemoveExperimentRowsRequest",
+        "UpdateExperimentRowsRequest",
+        "AddExperimentColumnsRequest",
+        "RemoveExperimentColumnsRequest",
+        "UpdateExperimentColumnsRequest",
+        "RunExperimentRequest",
+        "RunExperimentEvalsRequest",
+    ),
+    "respan.types.prompt_types": (
+        "Prompt",
+        "PromptVersion",
+        "PromptCreateResponse",
+        "PromptListResponse",
+        "PromptRetrieveResponse",
+        "PromptVersionCreateResponse",
+        "PromptVersionListResponse",
+        "PromptVersionRetrieveResponse",
+    ),
+    "respan.constants.dataset_constants": (
+        "DatasetType",
+        "DatasetStatus",
+        "DatasetLLMRunStatus",
+        "DATASET_TYPE_LLM",
+        "DATASET_TYPE_SAMPLING",
+        "DATASET_STATUS_INITIALIZING",
+        "DATASET_STATUS_READY",
+        "DATASET_STATUS_RUNNING",
+        "DATASET_STATUS_COMPLETED",
+        "DATASET_STATUS_FAILED",
+        "DATASET_STATUS_LOADING",
+        "DATASET_LLM_RUN_STATUS_PENDING",
+        "DATASET_LLM_RUN_STATUS_RUNNING",
+        "DATASET_LLM_RUN_STATUS_COMPLETED",
+        "DATASET_LLM_RUN_STATUS_FAILED",
+        "DATASET_LLM_RUN_STATUS_CANCELLED",
+    ),
+    "respan.constants.prompt_constants": (
+        "MessageRoleType",
+        "ResponseFormatType",
+        "ToolChoiceType",
+        "ReasoningEffortType",
+        "ActivityType",
+        "DEFAULT_MODEL",
+        "ACTIVITY_TYPE_PROMPT_CREATION",
+        "ACTIVITY_TYPE_COMMIT",
+        "ACTIVITY_TYPE_UPDATE",
+        "ACTIVITY_TYPE_DELETE",
+    ),
+}
+_LAZY_IMPORTS = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if os.environ.get("RESPAN_EAGER_IMPORTS", "").lower() in ("1", "true", "yes"):
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
@@ -94,7 +94,12 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
         - Use client.method() for synchronous operations
     """
 
-    def __init__(self, api_key: str, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        **client_options,
+    ):
         """
         Initialize the Dataset API client.
 
@@ -102,8 +107,9 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
             api_key (str): Your Respan API key for authentication
             base_url (str, optional): Custom base URL for the API. If not provided,
                 uses the default Respan API endpoint.
+            **client_options: Connection options (http2, limits, transport), see BaseAPI.
         """
-        super().__init__(api_key, base_url)
+        super().__init__(api_key, base_url, **client_options)
 
     # Asynchronous methods (with "a" prefix)
     async def acreate(self, create_data: Union[Dict[str, Any], DatasetCreate]) -> Dataset:
@@ -209,12 +215,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
             ...     created_after="2024-01-01T00:00:00Z"
             ... )
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(DATASET_LIST_PATH, params=params)
         return DatasetList(**response)
@@ -345,12 +346,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
         self, page: Optional[int] = None, page_size: Optional[int] = None, **filters
     ) -> DatasetList:
         """List datasets with optional filtering and pagination (synchronous)."""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(DATASET_LIST_PATH, params=params)
         return DatasetList(**response)
@@ -515,11 +511,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
             >>> for log in logs['results'][:3]:
             ...     print(f"Log {log['id']}: {log['status']} - {log['timestamp']}")
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
+        params = self._list_params(page, page_size)
 
         return await self.client.get(
             f"{DATASET_BASE_PATH}/{dataset_id}/logs", params=params
@@ -532,11 +524,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
         page_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         """List logs contained within a specific dataset (synchronous)."""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
+        params = self._list_params(page, page_size)
 
         return self.sync_client.get(
             f"{DATASET_BASE_PATH}/{dataset_id}/logs", params=params
@@ -631,12 +619,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
         **filters,
     ) -> EvalReportList:
         """List evaluation reports for a dataset (asynchronous)"""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(
             f"{DATASET_BASE_PATH}/{dataset_id}/eval-reports/list/", params=params
@@ -651,12 +634,7 @@ class DatasetAPI(BaseAPI[Dataset, DatasetList, DatasetCreate, DatasetUpdate]):
         **filters,
     ) -> EvalReportList:
         """List evaluation reports for a dataset (synchronous)"""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(
             f"{DATASET_BASE_PATH}/{dataset_id}/eval-reports/list/", params=params
@@ -6,16 +6,23 @@ This module provides functionality for managing evaluators, including:
 - Getting evaluator details
 - Running evaluations
 - Managing evaluation reports
+
+Names are imported on first access, so importing the package alone does not
+load the HTTP client or the pydantic models.
 """
 
-from respan.evaluators.api import (
-    EvaluatorAPI,
-    create_evaluator_client,
-)
-from respan.types.evaluator_types import (
-    Evaluator,
-    EvaluatorList,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from respan.evaluators.api import (
+        EvaluatorAPI,
+        create_evaluator_client,
+    )
+    from respan.types.evaluator_types import (
+        Evaluator,
+        EvaluatorList,
+    )
 
 # Export main classes and functions
 __all__ = [
@@ -25,3 +32,23 @@ __all__ = [
     "Evaluator",
     "EvaluatorList",
 ]
+
+_LAZY_IMPORTS = {
+    "EvaluatorAPI": "respan.evaluators.api",
+    "create_evaluator_client": "respan.evaluators.api",
+    "Evaluator": "respan.types.evaluator_types",
+    "EvaluatorList": "respan.types.evaluator_types",
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
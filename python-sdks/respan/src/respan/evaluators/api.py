@@ -8,14 +8,15 @@ This module provides functionality for managing evaluators, including:
 - Managing evaluation reports
 """
 
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
 from respan.types.evaluator_types import (
     Evaluator,
     EvaluatorList,
 )
 from respan.utils.base import BaseAPI
 from respan.constants.evaluator_constants import (
-    EVALUATOR_BASE_PATH,
     EVALUATOR_LIST_PATH,
     EVALUATOR_GET_PATH,
 )
@@ -80,7 +81,13 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
         evaluators through this API. Use the web interface to manage custom evaluators.
     """
     
-    def __init__(self, api_key: str, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        cache_ttl: Optional[float] = 300,
+        **client_options,
+    ):
         """
         Initialize the Evaluator API client.
         
@@ -88,8 +95,57 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
             api_key (str): Your Respan API key for authentication
             base_url (str, optional): Custom base URL for the API. If not provided,
                 uses the default Respan API endpoint.
+            cache_ttl (float, optional): Seconds that get()/list() responses are
+                served from an in-process cache. Evaluators are read-only
+                through this API, so repeated lookups (e.g. once per dataset
+                row) skip the network. Pass 0 or None to disable caching.
+            **client_options: Connection options (http2, limits, transport), see BaseAPI.
+        """
+        super().__init__(api_key, base_url, **client_options)
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+
+    # Response cache
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        if not self.cache_ttl:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.cache_ttl:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+    def _cache_set(self, key: Tuple[Any, ...], value: Any) -> Any:
+        if self.cache_ttl:
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), value)
+        return value
+
+    @staticmethod
+    def _list_cache_key(params: Dict[str, Any]) -> Tuple[Any, ...]:
+        # repr() keeps unhashable filter values (e.g. lists) usable as keys
+        return ("list",) + tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+    def invalidate(self, resource_id: Optional[str] = None) -> None:
         """
-        super().__init__(api_key, base_url)
+        Drop cached evaluator responses.
+
+        Args:
+            resource_id (str, optional): Evaluator whose cached get() response
+                should be dropped, along with all cached list() pages. Clears the
+                whole cache when omitted.
+        """
+        with self._cache_lock:
+            if resource_id is None:
+                self._cache.clear()
+                return
+            self._cache.pop(("get", resource_id), None)
+            for key in [key for key in self._cache if key[0] == "list"]:
+                del self._cache[key]
     
     # Asynchronous methods (with "a" prefix)
     async def alist(
@@ -134,15 +190,14 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
             >>> accuracy_evaluators = await client.alist(category="accuracy")
             >>> custom_evaluators = await client.alist(type="custom")
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
+        cache_key = self._list_cache_key(params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         response = await self.client.get(EVALUATOR_LIST_PATH, params=params)
-        return EvaluatorList(**response)
+        return self._cache_set(cache_key, EvaluatorList(**response))
 
     async def aget(self, resource_id: str) -> Evaluator:
         """
@@ -179,8 +234,12 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
             >>> # Get evaluator by ID
             >>> evaluator = await client.aget("eval-123")
         """
+        cached = self._cache_get(("get", resource_id))
+        if cached is not None:
+            return cached
+
         response = await self.client.get(f"{EVALUATOR_GET_PATH}/{resource_id}")
-        return Evaluator(**response)
+        return self._cache_set(("get", resource_id), Evaluator(**response))
 
     async def acreate(self, create_data) -> Evaluator:
         """
@@ -235,15 +294,14 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
         """
         List available evaluators with optional filtering and pagination (synchronous).
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
+        cache_key = self._list_cache_key(params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         response = self.sync_client.get(EVALUATOR_LIST_PATH, params=params)
-        return EvaluatorList(**response)
+        return self._cache_set(cache_key, EvaluatorList(**response))
     
     def get(self, resource_id: str) -> Evaluator:
         """
@@ -262,8 +320,12 @@ class EvaluatorAPI(BaseAPI[Evaluator, EvaluatorList, None, None]):
             >>> print(f"Description: {evaluator.description}")
             >>> print(f"Category: {evaluator.category}")
         """
+        cached = self._cache_get(("get", resource_id))
+        if cached is not None:
+            return cached
+
         response = self.sync_client.get(f"{EVALUATOR_GET_PATH}/{resource_id}")
-        return Evaluator(**response)
+        return self._cache_set(("get", resource_id), Evaluator(**response))
 
     def create(self, create_data) -> Evaluator:
         """
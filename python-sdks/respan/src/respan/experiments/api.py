@@ -8,7 +8,7 @@ This module provides functionality for managing experiments, including:
 - Listing and retrieving experiment information
 """
 
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Union
 from respan.types.experiment_types import (
     Experiment,
     ExperimentList,
@@ -117,7 +117,12 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
         - Use client.method() for synchronous operations
     """
 
-    def __init__(self, api_key: str, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        **client_options,
+    ):
         """
         Initialize the Experiment API client.
 
@@ -125,8 +130,9 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
             api_key (str): Your Respan API key for authentication
             base_url (str, optional): Custom base URL for the API. If not provided,
                 uses the default Respan API endpoint.
+            **client_options: Connection options (http2, limits, transport), see BaseAPI.
         """
-        super().__init__(api_key, base_url)
+        super().__init__(api_key, base_url, **client_options)
 
     # Asynchronous methods (with "a" prefix)
     async def acreate(self, create_data: Union[Dict[str, Any], ExperimentCreate]) -> Experiment:
@@ -230,12 +236,7 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
             ...     created_after="2024-01-01T00:00:00Z"
             ... )
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(EXPERIMENT_LIST_PATH, params=params)
         return ExperimentList(**response)
@@ -365,12 +366,7 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
         self, page: Optional[int] = None, page_size: Optional[int] = None, **filters
     ) -> ExperimentList:
         """List experiments with optional filtering and pagination (synchronous)."""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(EXPERIMENT_LIST_PATH, params=params)
         return ExperimentList(**response)
@@ -535,11 +531,11 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
             >>> result = await client.aupdate_rows("experiment-123", update_request)
         """
         # Validate and prepare the input data
-        validated_data = self._validate_input(rows_request, UpdateExperimentRowsRequest)
+        validated_data = self._validate_input(rows_request, UpdateExperimentRowsRequest, partial=True)
         
         return await self.client.patch(
             EXPERIMENT_UPDATE_ROWS_PATH(experiment_id),
-            json_data=self._prepare_json_data(validated_data),
+            json_data=self._prepare_json_data(validated_data, partial=True),
         )
 
     def update_rows(
@@ -547,11 +543,11 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
     ) -> Dict[str, Any]:
         """Update existing rows in an experiment (synchronous)."""
         # Validate and prepare the input data
-        validated_data = self._validate_input(rows_request, UpdateExperimentRowsRequest)
+        validated_data = self._validate_input(rows_request, UpdateExperimentRowsRequest, partial=True)
         
         return self.sync_client.patch(
             EXPERIMENT_UPDATE_ROWS_PATH(experiment_id),
-            json_data=self._prepare_json_data(validated_data),
+            json_data=self._prepare_json_data(validated_data, partial=True),
         )
 
     # Column management methods (both sync and async variants)
@@ -698,11 +694,11 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
             >>> result = await client.aupdate_columns("experiment-123", update_request)
         """
         # Validate and prepare the input data
-        validated_data = self._validate_input(columns_request, UpdateExperimentColumnsRequest)
+        validated_data = self._validate_input(columns_request, UpdateExperimentColumnsRequest, partial=True)
         
         return await self.client.patch(
             EXPERIMENT_UPDATE_COLUMNS_PATH(experiment_id),
-            json_data=self._prepare_json_data(validated_data),
+            json_data=self._prepare_json_data(validated_data, partial=True),
         )
 
     def update_columns(
@@ -710,11 +706,11 @@ class ExperimentAPI(BaseAPI[Experiment, ExperimentList, ExperimentCreate, Experi
     ) -> Dict[str, Any]:
         """Update existing columns in an experiment (synchronous)."""
         # Validate and prepare the input data
-        validated_data = self._validate_input(columns_request, UpdateExperimentColumnsRequest)
+        validated_data = self._validate_input(columns_request, UpdateExperimentColumnsRequest, partial=True)
         
         return self.sync_client.patch(
             EXPERIMENT_UPDATE_COLUMNS_PATH(experiment_id),
-            json_data=self._prepare_json_data(validated_data),
+            json_data=self._prepare_json_data(validated_data, partial=True),
         )
 
     # Experiment execution methods (both sync and async variants)
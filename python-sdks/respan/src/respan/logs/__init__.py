@@ -1,9 +1,35 @@
-from .api import (
-    LogAPI,
-    create_log_client,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import (
+        LogAPI,
+        LogBatchCollector,
+        create_log_client,
+    )
 
 __all__ = [
     "LogAPI",
+    "LogBatchCollector",
     "create_log_client",
 ]
+
+# Loaded on first access so importing the package does not pull in httpx
+_LAZY_IMPORTS = {
+    "LogAPI": ".api",
+    "LogBatchCollector": ".api",
+    "create_log_client": ".api",
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
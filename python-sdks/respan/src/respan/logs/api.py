@@ -9,7 +9,8 @@ This module provides functionality for managing logs, including:
 Note: Logs do not support update or delete operations.
 """
 
-from typing import Optional, Dict, Any, Union
+import asyncio
+from typing import Optional, Dict, Any, Iterable, List, Union
 from respan.types.log_types import (
     RespanLogParams,
     RespanFullLogParams,
@@ -88,7 +89,12 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
         NotImplementedError if called.
     """
 
-    def __init__(self, api_key: str = None, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        **client_options,
+    ):
         """
         Initialize the Log API client.
 
@@ -97,8 +103,9 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
                 If not provided, reads from RESPAN_API_KEY environment variable.
             base_url (str, optional): Custom base URL for the API. If not provided,
                 reads from RESPAN_BASE_URL environment variable or uses default.
+            **client_options: Connection options (http2, limits, transport), see BaseAPI.
         """
-        super().__init__(api_key, base_url)
+        super().__init__(api_key, base_url, **client_options)
 
     # Asynchronous methods (with "a" prefix)
     async def acreate(self, create_data: Union[Dict[str, Any], RespanLogParams]) -> Dict[str, Any]:
@@ -151,12 +158,44 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
         # Validate and prepare the input data
         validated_data = self._validate_input(create_data, RespanLogParams)
         
+        # Serialize straight to JSON bytes instead of building an intermediate dict
         response = await self.client.post(
             LOG_CREATION_PATH,
-            json_data=self._prepare_json_data(validated_data),
+            content=validated_data.model_dump_json(exclude_none=True).encode(),
         )
         return response
 
+    async def acreate_batch(
+        self,
+        logs: Iterable[Union[Dict[str, Any], RespanLogParams]],
+        max_concurrency: int = 10,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create many logs concurrently (asynchronous).
+
+        The log create endpoint takes one log per request, so the logs are sent
+        as concurrent requests (at most ``max_concurrency`` in flight) over the
+        client's pooled connections rather than one round-trip after another.
+        All logs are validated before any request is sent.
+
+        Args:
+            logs: Log creation parameters, as accepted by ``acreate()``
+            max_concurrency (int): Maximum number of create requests in flight
+
+        Returns:
+            List of API responses, or the exception raised for each log that
+            failed, in input order
+
+        Raises:
+            ValueError: If any log fails validation
+
+        Example:
+            >>> results = await client.acreate_batch(logs)
+            >>> failed = [r for r in results if isinstance(r, Exception)]
+        """
+        validated_logs = [self._validate_input(log, RespanLogParams) for log in logs]
+        return await self._gather_bounded(self.acreate, validated_logs, max_concurrency)
+
     async def alist(
         self, page: Optional[int] = None, page_size: Optional[int] = None, **filters
     ) -> LogList:
@@ -203,12 +242,7 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
             ...     model="gpt-4"
             ... )
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(LOG_LIST_PATH, params=params)
         return LogList(**response)
@@ -282,22 +316,27 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
         # Validate and prepare the input data
         validated_data = self._validate_input(create_data, RespanLogParams)
         
+        # Serialize straight to JSON bytes instead of building an intermediate dict
         response = self.sync_client.post(
             LOG_CREATION_PATH,
-            json_data=self._prepare_json_data(validated_data),
+            content=validated_data.model_dump_json(exclude_none=True).encode(),
         )
         return response
 
+    def create_batch(
+        self,
+        logs: Iterable[Union[Dict[str, Any], RespanLogParams]],
+        max_concurrency: int = 10,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create many logs concurrently from a thread pool (synchronous)"""
+        validated_logs = [self._validate_input(log, RespanLogParams) for log in logs]
+        return self._map_threaded(self.create, validated_logs, max_concurrency)
+
     def list(
         self, page: Optional[int] = None, page_size: Optional[int] = None, **filters
     ) -> LogList:
         """List logs with optional filtering (synchronous)"""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(LOG_LIST_PATH, params=params)
         return LogList(**response)
@@ -336,6 +375,119 @@ class LogAPI(BaseAPI[RespanFullLogParams, LogList, RespanLogParams, None]):
             "Logs do not support delete operations. Logs are immutable for audit purposes."
         )
 
+    def batch(
+        self,
+        max_items: int = 100,
+        flush_interval: float = 1.0,
+        max_concurrency: int = 10,
+    ) -> "LogBatchCollector":
+        """
+        Create a collector that buffers logs and sends them in the background.
+
+        Args:
+            max_items (int): Number of buffered logs that triggers a flush
+            flush_interval (float): Seconds after the first buffered log before
+                the buffer is flushed anyway
+            max_concurrency (int): Maximum number of create requests in flight
+                during a flush
+
+        Returns:
+            LogBatchCollector: Use it with ``async with`` so remaining logs are
+            flushed on exit
+
+        Example:
+            >>> async with client.batch() as batch:
+            ...     for log_data in logs:
+            ...         await batch.add(log_data)
+        """
+        return LogBatchCollector(
+            self,
+            max_items=max_items,
+            flush_interval=flush_interval,
+            max_concurrency=max_concurrency,
+        )
+
+
+class LogBatchCollector:
+    """
+    Auto-flushing log writer for high-throughput logging (asynchronous).
+
+    Logs passed to ``add()`` are validated immediately and buffered. The buffer
+    is flushed once it holds ``max_items`` logs, or ``flush_interval`` seconds
+    after the first log was buffered, whichever comes first. The log create
+    endpoint takes one log per request, so a flush sends the buffered logs
+    concurrently (at most ``max_concurrency`` at a time) over the client's
+    pooled connections instead of one after another.
+
+    Failures from automatic (size- or timer-triggered) flushes are collected
+    in ``errors``; an explicit ``flush()`` returns them alongside the
+    successful responses.
+    """
+
+    def __init__(
+        self,
+        log_api: LogAPI,
+        max_items: int = 100,
+        flush_interval: float = 1.0,
+        max_concurrency: int = 10,
+    ):
+        self._log_api = log_api
+        self.max_items = max_items
+        self.flush_interval = flush_interval
+        self.max_concurrency = max_concurrency
+        self.errors: List[Exception] = []
+        self._items: List[RespanLogParams] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._background_flushes = set()
+
+    async def add(self, log_data: Union[Dict[str, Any], RespanLogParams]) -> None:
+        """Validate a log and buffer it, flushing if the buffer is full"""
+        self._items.append(self._log_api._validate_input(log_data, RespanLogParams))
+        if len(self._items) >= self.max_items:
+            await self._flush_and_record_errors()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._flush_in_background
+            )
+
+    def _flush_in_background(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self._flush_and_record_errors())
+        self._background_flushes.add(task)
+        task.add_done_callback(self._background_flushes.discard)
+
+    async def _flush_and_record_errors(self) -> None:
+        results = await self.flush()
+        self.errors.extend(r for r in results if isinstance(r, Exception))
+
+    async def flush(self) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Send all buffered logs now.
+
+        Returns:
+            List of API responses, or the exception raised for each log that
+            failed, in the order the logs were added
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._items = self._items, []
+        if not items:
+            return []
+        return await self._log_api.acreate_batch(items, max_concurrency=self.max_concurrency)
+
+    async def aclose(self) -> None:
+        """Flush remaining logs and wait for background flushes to finish"""
+        await self._flush_and_record_errors()
+        if self._background_flushes:
+            await asyncio.gather(*self._background_flushes)
+
+    async def __aenter__(self) -> "LogBatchCollector":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
 
 # Convenience functions for creating clients
 def create_log_client(api_key: str = None, base_url: str = None) -> LogAPI:
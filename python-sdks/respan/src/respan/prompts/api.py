@@ -8,7 +8,7 @@ This module provides functionality for managing prompts and prompt versions, inc
 - Updating prompt configurations
 """
 
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Union
 from respan_sdk.respan_types.prompt_types import (
     Prompt,
     PromptVersion,
@@ -97,7 +97,12 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
         - Use client.method() for synchronous operations
     """
 
-    def __init__(self, api_key: str, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        **client_options,
+    ):
         """
         Initialize the Prompt API client.
 
@@ -105,8 +110,9 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
             api_key (str): Your Respan API key for authentication
             base_url (str, optional): Custom base URL for the API. If not provided,
                 uses the default Respan API endpoint.
+            **client_options: Connection options (http2, limits, transport), see BaseAPI.
         """
-        super().__init__(api_key, base_url)
+        super().__init__(api_key, base_url, **client_options)
 
     # Asynchronous methods (with "a" prefix)
     async def acreate(
@@ -191,12 +197,7 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
             >>> # List with filters
             >>> starred_prompts = await client.alist(starred=True)
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(PROMPT_LIST_PATH, params=params)
         return PromptListResponse(**response)
@@ -325,12 +326,7 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
         self, page: Optional[int] = None, page_size: Optional[int] = None, **filters
     ) -> PromptListResponse:
         """List prompts with optional filtering and pagination (synchronous)."""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(PROMPT_LIST_PATH, params=params)
         return PromptListResponse(**response)
@@ -556,12 +552,7 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
             >>> for version in versions.results[:3]:
             ...     print(f"Version {version.version}: {version.model} - {version.description}")
         """
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = await self.client.get(
             PROMPT_VERSION_LIST_PATH(prompt_id), params=params
@@ -585,12 +576,7 @@ class PromptAPI(BaseAPI[PromptRetrieveResponse, PromptListResponse, Prompt, Prom
         **filters,
     ) -> PromptVersionListResponse:
         """List versions for a specific prompt (synchronous)."""
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if page_size is not None:
-            params["page_size"] = page_size
-        params.update(filters)
+        params = self._list_params(page, page_size, **filters)
 
         response = self.sync_client.get(
             PROMPT_VERSION_LIST_PATH(prompt_id), params=params
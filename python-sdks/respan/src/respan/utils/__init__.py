@@ -1 +1,30 @@
-from respan.utils.client import *
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from respan.utils.client import *
+
+# respan.utils.client imports httpx; load it only when a client is requested
+_LAZY_IMPORTS = {
+    "RespanClient": "respan.utils.client",
+    "SyncRespanClient": "respan.utils.client",
+    "create_client": "respan.utils.client",
+    "create_sync_client": "respan.utils.client",
+    "aclose_all": "respan.utils.client",
+    "close_all": "respan.utils.client",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
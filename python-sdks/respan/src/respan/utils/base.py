@@ -5,11 +5,18 @@ This module provides abstract base classes that define common CRUDL (Create, Rea
 operations for API clients with unified sync/async methods, ensuring consistent interfaces across different resource types.
 """
 
+import asyncio
+import math
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, TypeVar, Generic, Union
-from respan.utils.client import RespanClient, SyncRespanClient
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, Any, TypeVar, Generic, Union, Callable, Iterable, Iterator, AsyncIterator, List, Awaitable, Mapping, Tuple
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import httpx
+    from respan.utils.client import RespanClient, SyncRespanClient
+
 # Generic type variables for flexibility
 T = TypeVar('T')  # For individual resource types
 TList = TypeVar('TList')  # For list response types
@@ -25,11 +32,60 @@ class BaseAPI(ABC, Generic[T, TList, TCreate, TUpdate]):
     The methods automatically detect the calling context and use the appropriate client.
     """
     
-    def __init__(self, api_key: str, base_url: str = None):
-        self.async_client = RespanClient(api_key=api_key, base_url=base_url)
-        self.sync_client = SyncRespanClient(api_key=api_key, base_url=base_url)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        http2: Optional[bool] = None,
+        limits: Optional["httpx.Limits"] = None,
+        transport: Optional[Union["httpx.BaseTransport", "httpx.AsyncBaseTransport"]] = None,
+    ):
+        """
+        Initialize the sync and async HTTP clients.
+
+        Args:
+            api_key (str): Your Respan API key for authentication
+            base_url (str, optional): Custom base URL for the API
+            http2 (bool, optional): Force HTTP/2 on or off. Defaults to on when
+                the optional h2 package is installed; lets concurrent calls such
+                as get_many() multiplex over one connection.
+            limits (httpx.Limits, optional): Connection pool limits. Passing
+                http2 or limits gives this client its own connection pool
+                instead of the one shared by all clients.
+            transport (optional): httpx transport used by both the sync and
+                async client, so it must support both - e.g. httpx.MockTransport
+                to serve canned responses in tests. Also gives dedicated pools.
+        """
+        # Imported here so loading an API module does not import httpx
+        from respan.utils.client import RespanClient, SyncRespanClient
+
+        client_options = {"http2": http2, "limits": limits, "transport": transport}
+        self.async_client = RespanClient(api_key=api_key, base_url=base_url, **client_options)
+        self.sync_client = SyncRespanClient(api_key=api_key, base_url=base_url, **client_options)
         # For backward compatibility with async methods that use self.client
         self.client = self.async_client
+
+    # Connection pool lifecycle
+    async def aclose(self) -> None:
+        """Close the pooled connections held by this API client (async version)"""
+        await self.async_client.aclose()
+        self.sync_client.close()
+
+    def close(self) -> None:
+        """Close the pooled connections held by this API client (synchronous version)"""
+        self.sync_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _validate_input(self, data: Union[Dict[str, Any], BaseModel], model_class: type, partial: bool = False) -> BaseModel:
         """
@@ -48,29 +104,22 @@ class BaseAPI(ABC, Generic[T, TList, TCreate, TUpdate]):
         """
         if isinstance(data, dict):
             try:
-                if partial:
-                    # For partial updates, only create model with provided fields
-                    # This prevents default values from being set for unspecified fields
-                    return model_class.model_validate(data)
-                else:
-                    # For full validation, use standard constructor
-                    return model_class(**data)
+                # model_validate records only the provided keys as set, so partial
+                # updates later dump just those fields (exclude_unset=True)
+                return model_class.model_validate(data)
             except Exception as e:
                 raise ValueError(f"Invalid data for {model_class.__name__}: {str(e)}")
         elif isinstance(data, BaseModel):
-            # If it's already a Pydantic model, validate it's the correct type
-            if not isinstance(data, model_class):
-                # Try to convert if it's a different Pydantic model
-                try:
-                    if partial:
-                        # For partial updates, only include fields that were explicitly set
-                        dump_data = data.model_dump(exclude_unset=True)
-                        return model_class.model_validate(dump_data)
-                    else:
-                        return model_class(**data.model_dump())
-                except Exception as e:
-                    raise ValueError(f"Cannot convert {type(data).__name__} to {model_class.__name__}: {str(e)}")
-            return data
+            # Already the right model: it was validated on construction, reuse as-is
+            if isinstance(data, model_class):
+                return data
+            # Try to convert if it's a different Pydantic model
+            try:
+                # For partial updates, only include fields that were explicitly set
+                dump_data = data.model_dump(exclude_unset=partial)
+                return model_class.model_validate(dump_data)
+            except Exception as e:
+                raise ValueError(f"Cannot convert {type(data).__name__} to {model_class.__name__}: {str(e)}")
         else:
             raise ValueError(f"Data must be a dictionary or {model_class.__name__} instance, got {type(data)}")
     
@@ -97,6 +146,51 @@ class BaseAPI(ABC, Generic[T, TList, TCreate, TUpdate]):
         else:
             raise ValueError(f"Data must be a dictionary or Pydantic model, got {type(data)}")
     
+    @staticmethod
+    def _list_params(
+        page: Optional[int] = None, page_size: Optional[int] = None, **filters
+    ) -> Dict[str, Any]:
+        """Query parameters for list endpoints; page/page_size are sent only when given"""
+        params = {
+            key: value
+            for key, value in (("page", page), ("page_size", page_size))
+            if value is not None
+        }
+        params.update(filters)
+        return params
+
+    @staticmethod
+    async def _gather_bounded(
+        func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], max_concurrency: int
+    ) -> List[Any]:
+        """
+        Await func(item) for every item with at most max_concurrency calls in flight.
+
+        Returns results in input order; a call that raised yields its exception.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(item):
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+
+    @staticmethod
+    def _map_threaded(
+        func: Callable[[Any], Any], items: Iterable[Any], max_concurrency: int
+    ) -> List[Any]:
+        """Synchronous counterpart of _gather_bounded using a thread pool"""
+
+        def call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(call, items))
+
     # Unified methods that work in both sync and async contexts
     @abstractmethod
     async def acreate(self, create_data: Union[Dict[str, Any], TCreate]) -> T:
@@ -204,4 +298,130 @@ class BaseAPI(ABC, Generic[T, TList, TCreate, TUpdate]):
         """
         Delete a resource (synchronous version)
         """
-        pass
\ No newline at end of file
+        pass
+
+    # Concurrent fan-out over the single-item methods
+    async def aget_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Union[T, Exception]]:
+        """
+        Retrieve several resources concurrently (asynchronous version)
+
+        Requests share the client's connection pool; at most max_concurrency
+        are in flight so bursts stay within the API rate limits.
+
+        Returns:
+            The resource, or the exception raised for it, per ID in input order
+        """
+        return await self._gather_bounded(self.aget, resource_ids, max_concurrency)
+
+    def get_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Union[T, Exception]]:
+        """
+        Retrieve several resources concurrently (synchronous version)
+        """
+        return self._map_threaded(self.get, resource_ids, max_concurrency)
+
+    async def aupdate_many(
+        self,
+        updates: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        max_concurrency: int = 10,
+    ) -> List[Union[T, Exception]]:
+        """
+        Update several resources concurrently (asynchronous version)
+
+        Args:
+            updates: Mapping (or pairs) of resource ID to update data
+
+        Returns:
+            The updated resource, or the exception raised for it, per ID in input order
+        """
+        pairs = updates.items() if isinstance(updates, Mapping) else updates
+        return await self._gather_bounded(
+            lambda pair: self.aupdate(*pair), pairs, max_concurrency
+        )
+
+    def update_many(
+        self,
+        updates: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        max_concurrency: int = 10,
+    ) -> List[Union[T, Exception]]:
+        """
+        Update several resources concurrently (synchronous version)
+        """
+        pairs = updates.items() if isinstance(updates, Mapping) else updates
+        return self._map_threaded(lambda pair: self.update(*pair), pairs, max_concurrency)
+
+    async def adelete_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Delete several resources concurrently (asynchronous version)
+
+        Returns:
+            The API response, or the exception raised, per ID in input order
+        """
+        return await self._gather_bounded(self.adelete, resource_ids, max_concurrency)
+
+    def delete_many(
+        self, resource_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Delete several resources concurrently (synchronous version)
+        """
+        return self._map_threaded(self.delete, resource_ids, max_concurrency)
+
+    # Auto-pagination
+    async def aiter_all(
+        self, page_size: int = 100, prefetch: int = 2, **filters
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over every resource across all pages (asynchronous version)
+
+        The first page gives the total count and the page size the server
+        actually serves, which may be capped below ``page_size``; after that up
+        to ``prefetch`` following pages are requested ahead while earlier items
+        are consumed, so page round-trips overlap with the caller's work.
+
+        Example:
+            >>> async for dataset in client.aiter_all(page_size=50):
+            ...     print(dataset.name)
+        """
+        first_page = await self.alist(page=1, page_size=page_size, **filters)
+        for item in first_page.results:
+            yield item
+        if first_page.next is None or not first_page.results:
+            return
+
+        # A page with a next link is full, so its length is the served page size
+        total_pages = math.ceil(first_page.count / len(first_page.results))
+        next_page = 2
+        pending = deque()
+        try:
+            while pending or next_page <= total_pages:
+                while next_page <= total_pages and len(pending) < max(1, prefetch):
+                    pending.append(asyncio.ensure_future(
+                        self.alist(page=next_page, page_size=page_size, **filters)
+                    ))
+                    next_page += 1
+                page = await pending.popleft()
+                for item in page.results:
+                    yield item
+                if not page.results:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def iter_all(self, page_size: int = 100, **filters) -> Iterator[T]:
+        """
+        Iterate over every resource across all pages (synchronous version)
+        """
+        page_number = 1
+        while True:
+            page = self.list(page=page_number, page_size=page_size, **filters)
+            yield from page.results
+            if page.next is None or not page.results:
+                return
+            page_number += 1
@@ -7,22 +7,278 @@ It handles authentication, common headers, and provides both async and sync inte
 
 import httpx
 import asyncio
-from functools import wraps
-from typing import Optional, Dict, Any, Union
+import importlib.util
+import random
+import threading
+import time
+import warnings
+import weakref
+from functools import partial, wraps
+from typing import Optional, Dict, Any
 from respan.constants import BASE_URL_SUFFIX, RESPAN_DEFAULT_BASE_URL
 import os
 
 
+# Connection pool limits shared by the async and sync clients
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# HTTP/2 lets concurrent requests multiplex over one connection. It needs the
+# optional ``h2`` package (``pip install respan-ai[http2]``); servers that do
+# not offer HTTP/2 are still spoken to over HTTP/1.1.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+
+# Retries for transient failures. 429/503 mean the server rejected the request
+# without acting on it, so every method is resent; 502/504 may hide a request
+# that was processed, so they are only retried for GET. Errors raised before
+# the request reached the server are always safe to resend.
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUS_CODES = frozenset({429, 503})
+GET_RETRY_STATUS_CODES = RETRY_STATUS_CODES | {502, 504}
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _should_retry(method: str, response: httpx.Response) -> bool:
+    codes = GET_RETRY_STATUS_CODES if method == "GET" else RETRY_STATUS_CODES
+    return response.status_code in codes
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based), honouring Retry-After"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), RETRY_MAX_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    delay = min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _timeout_config(timeout: Optional[int]) -> Optional[httpx.Timeout]:
+    """Per-request timeout; ``None`` disables the timeout, as before pooling"""
+    return httpx.Timeout(timeout) if timeout else None
+
+
+def _body(json_data: Optional[Dict[str, Any]], content: Optional[bytes]) -> Dict[str, Any]:
+    """Request body kwargs; pre-serialized ``content`` takes precedence over ``json_data``"""
+    return {"content": content} if content is not None else {"json": json_data}
+
+
+class _SharedPool:
+    """
+    A pooled httpx client shared by every Respan client, closed by its last user
+
+    Auth headers are sent per request, so clients with different API keys or
+    base URLs can safely share connections.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._client = None
+        self._refs = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = self._factory()
+                self._refs = 0
+            self._refs += 1
+            return self._client
+
+    def release(self, client) -> bool:
+        """Drop one reference; returns True when the caller should close the pool"""
+        with self._lock:
+            if client is not self._client:
+                return False
+            self._refs -= 1
+            if self._refs > 0:
+                return False
+            self._client = None
+            return True
+
+    def detach(self):
+        """Forget the current client regardless of its users and return it"""
+        with self._lock:
+            client, self._client, self._refs = self._client, None, 0
+            return client
+
+
+class _LoopPool(_SharedPool):
+    """
+    A shared async pool that is also closed when its event loop shuts down
+
+    Async connections can no longer be closed once their loop is closed, so the
+    first acquire() starts a task that only finishes when it is cancelled -
+    which asyncio.run() does to pending tasks before closing the loop - and
+    then closes the pool and removes it from ``pools``. That task references
+    the loop, so the weak ``pools`` key alone would never let the entry go.
+    """
+
+    def __init__(
+        self, factory, pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPool]"
+    ):
+        super().__init__(factory)
+        self._pools = pools
+        self._closer: Optional[asyncio.Task] = None
+
+    def acquire(self):
+        client = super().acquire()
+        if self._closer is None or self._closer.done():
+            self._closer = asyncio.get_running_loop().create_task(self._close_at_shutdown())
+        return client
+
+    async def aclose(self) -> None:
+        """Close the pool now, whoever still holds it"""
+        if self._closer is not None:
+            self._closer.cancel()
+        http_client = self.detach()
+        if http_client is not None:
+            await http_client.aclose()
+
+    async def _close_at_shutdown(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.create_future()
+        finally:
+            with _async_pools_lock:
+                if self._pools.get(loop) is self:
+                    del self._pools[loop]
+            http_client = self.detach()
+            if http_client is not None:
+                await http_client.aclose()
+
+
+def _close_on_loop(http_client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+    """
+    Close an async pool from outside the event loop it belongs to
+
+    Returns:
+        The concurrent future of the close scheduled on ``loop``, or None if
+        the pool is already closed or its loop is gone
+    """
+    if http_client.is_closed:
+        return None
+    if loop.is_closed():
+        warnings.warn(
+            "Respan connection pool left open: its event loop was closed "
+            "without cancelling pending tasks",
+            ResourceWarning,
+            stacklevel=3,
+        )
+        return None
+    return asyncio.run_coroutine_threadsafe(http_client.aclose(), loop)
+
+
+def _new_async_pool(
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    http2: bool = HTTP2_ENABLED,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(limits=limits, http2=http2, transport=transport)
+
+
+def _new_sync_pool(
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    http2: bool = HTTP2_ENABLED,
+    transport: Optional[httpx.BaseTransport] = None,
+) -> httpx.Client:
+    return httpx.Client(limits=limits, http2=http2, transport=transport)
+
+
+def _pool_options(
+    http2: Optional[bool], limits: Optional[httpx.Limits], transport: Any = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Factory kwargs for a dedicated pool, or None to use the shared pools
+
+    Raises:
+        ImportError: If HTTP/2 is requested but the h2 package is missing
+    """
+    if http2 is None and limits is None and transport is None:
+        return None
+    if http2 and not HTTP2_ENABLED:
+        raise ImportError("http2=True requires the h2 package: pip install respan-ai[http2]")
+    return {
+        "limits": DEFAULT_LIMITS if limits is None else limits,
+        "http2": HTTP2_ENABLED if http2 is None else http2,
+        "transport": transport,
+    }
+
+
+# httpx async connections are bound to the loop that opened them, so there is
+# one shared async pool per event loop (dropped when the loop shuts down)
+_async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPool]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_pools_lock = threading.Lock()
+_sync_pool = _SharedPool(_new_sync_pool)
+
+
+async def aclose_all() -> None:
+    """
+    Close the shared async pool of the running event loop
+
+    Meant for application shutdown: clients that were never closed lose their
+    connections, and any later request simply opens a fresh pool.
+    """
+    with _async_pools_lock:
+        pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
+
+
+def close_all() -> None:
+    """Close the shared sync pool (see aclose_all)"""
+    http_client = _sync_pool.detach()
+    if http_client is not None:
+        http_client.close()
+
+
+def _async_pool_for(
+    loop: asyncio.AbstractEventLoop,
+    pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedPool]" = _async_pools,
+    factory=_new_async_pool,
+) -> _SharedPool:
+    with _async_pools_lock:
+        pool = pools.get(loop)
+        if pool is None:
+            pool = pools[loop] = _LoopPool(factory, pools)
+        return pool
+
+
 class RespanClient:
-    """Centralized async HTTP client for Respan API"""
+    """Centralized async HTTP client for Respan API
+
+    Requests go through an ``httpx.AsyncClient`` pool shared by every client
+    on the same event loop, so consecutive calls - and new API instances -
+    reuse keep-alive connections. ``aclose()`` / ``async with`` releases this
+    client's share; the pool is closed once its last user releases it.
+    Passing ``http2``, ``limits`` or ``transport`` gives the client a
+    dedicated pool instead.
+    """
 
-    def __init__(self, api_key: str = None, base_url: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Initialize the Respan client
 
         Args:
             api_key: Respan API key
             base_url: Base URL for the API RESPAN_DEFAULT_BASE_URL
+            http2: Force HTTP/2 on or off (default: on when h2 is installed)
+            limits: Connection pool limits (default: DEFAULT_LIMITS)
+            transport: httpx transport to send requests through, e.g. an
+                httpx.MockTransport in tests (default: network connections)
         """
         if not base_url:
             base_url = os.getenv("RESPAN_BASE_URL", RESPAN_DEFAULT_BASE_URL)
@@ -36,6 +292,86 @@ class RespanClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        # Set to 0 to disable retries of transient failures
+        self.max_retries = DEFAULT_MAX_RETRIES
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        options = _pool_options(http2, limits, transport)
+        if options is None:
+            self._pools, self._pool_factory = _async_pools, _new_async_pool
+        else:
+            self._pools = weakref.WeakKeyDictionary()
+            self._pool_factory = partial(_new_async_pool, **options)
+
+    def _pool_for(self, loop: asyncio.AbstractEventLoop) -> _SharedPool:
+        return _async_pool_for(loop, self._pools, self._pool_factory)
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _request_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared AsyncClient for the running event loop
+
+        httpx connections are bound to the loop that opened them, so a
+        different pool is used when the client is called from another loop
+        (e.g. across separate asyncio.run() calls), and the share of the old
+        loop's pool is released.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is not None and self._http_client_loop is not loop:
+            http_client, old_loop = self._release()
+            if http_client is not None:
+                _close_on_loop(http_client, old_loop)
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = self._pool_for(loop).acquire()
+            self._http_client_loop = loop
+        return self._http_client
+
+    def _release(self):
+        """
+        Drop this client's share of its pool
+
+        Returns:
+            The pool and its event loop when this was the last user and the
+            pool should now be closed, else (None, None)
+        """
+        http_client, self._http_client = self._http_client, None
+        loop, self._http_client_loop = self._http_client_loop, None
+        if http_client is None or not self._pool_for(loop).release(http_client):
+            return None, None
+        return http_client, loop
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        url, request_headers = self._url(endpoint), self._request_headers(headers)
+        for attempt in range(self.max_retries + 1):
+            is_last = attempt == self.max_retries
+            try:
+                response = await self._get_http_client().request(
+                    method, url, headers=request_headers, **kwargs
+                )
+            except RETRYABLE_ERRORS:
+                if is_last:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            if is_last or not _should_retry(method, response):
+                break
+            await asyncio.sleep(_retry_delay(attempt, response))
+        response.raise_for_status()
+        return response.json()
 
     async def get(
         self,
@@ -54,18 +390,7 @@ class RespanClient:
         Returns:
             Response JSON data
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/{endpoint.lstrip('/')}",
-                params=params,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("GET", endpoint, headers, params=params)
 
     async def post(
         self,
@@ -73,6 +398,7 @@ class RespanClient:
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """
         Make a POST request
@@ -81,25 +407,14 @@ class RespanClient:
             endpoint: API endpoint (without base URL)
             json_data: JSON data to send
             headers: Additional headers
+            content: Already-serialized JSON body, sent instead of json_data
 
         Returns:
             Response JSON data
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        # Configure timeout properly for httpx
-        timeout_config = httpx.Timeout(timeout) if timeout else None
-
-        async with httpx.AsyncClient(timeout=timeout_config) as client:
-            response = await client.post(
-                f"{self.base_url}/{endpoint.lstrip('/')}",
-                json=json_data,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request(
+            "POST", endpoint, headers, timeout=_timeout_config(timeout), **_body(json_data, content)
+        )
 
     async def patch(
         self,
@@ -118,18 +433,7 @@ class RespanClient:
         Returns:
             Response JSON data
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/{endpoint.lstrip('/')}",
-                json=json_data,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("PATCH", endpoint, headers, json=json_data)
 
     async def delete(
         self,
@@ -150,21 +454,34 @@ class RespanClient:
         Returns:
             Response JSON data
         """
-        request_headers = self.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        return await self._request(
+            "DELETE", endpoint, headers, json=json_data, timeout=_timeout_config(timeout)
+        )
+
+    async def aclose(self) -> None:
+        """
+        Release the shared pool, closing it if no other client is using it
+
+        A pool opened on another event loop is closed on that loop: awaited if
+        the loop is running (e.g. in another thread), otherwise scheduled for
+        when it next runs.
+        """
+        loop = self._http_client_loop
+        http_client, _ = self._release()
+        if http_client is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await http_client.aclose()
+            return
+        future = _close_on_loop(http_client, loop)
+        if future is not None and loop.is_running():
+            await asyncio.wrap_future(future)
 
-        # Configure timeout properly for httpx
-        timeout_config = httpx.Timeout(timeout) if timeout else None
+    async def __aenter__(self) -> "RespanClient":
+        return self
 
-        async with httpx.AsyncClient(timeout=timeout_config) as client:
-            response = await client.delete(
-                f"{self.base_url}/{endpoint.lstrip('/')}",
-                json=json_data,
-                headers=request_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
 
 def sync_wrapper(async_func):
@@ -178,59 +495,133 @@ def sync_wrapper(async_func):
 
 
 class SyncRespanClient:
-    """Synchronous wrapper around RespanClient"""
+    """Synchronous Respan API client
 
-    def __init__(self, api_key: str, base_url: str = None):
+    Requests go through an ``httpx.Client`` pool shared by every sync client
+    rather than a new event loop per call. ``close()`` / ``with`` releases this
+    client's share; the pool is closed once its last user releases it.
+    Passing ``http2``, ``limits`` or ``transport`` gives the client a
+    dedicated pool instead.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = None,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
         """
         Initialize the synchronous Respan client
 
         Args:
             api_key: Respan API key
             base_url: Base URL for the API (default: None)
+            http2: Force HTTP/2 on or off (default: on when h2 is installed)
+            limits: Connection pool limits (default: DEFAULT_LIMITS)
+            transport: httpx transport to send requests through, e.g. an
+                httpx.MockTransport in tests (default: network connections)
         """
         if not base_url:
             base_url = os.getenv("RESPAN_BASE_URL", RESPAN_DEFAULT_BASE_URL)
+        # Holds the resolved base URL and auth headers shared with the async client
         self._async_client = RespanClient(api_key=api_key, base_url=base_url)
-
-    @sync_wrapper
-    async def get(
+        # Set to 0 to disable retries of transient failures
+        self.max_retries = DEFAULT_MAX_RETRIES
+        self._http_client: Optional[httpx.Client] = None
+        self._http_client_lock = threading.Lock()
+        options = _pool_options(http2, limits, transport)
+        self._pool = _sync_pool if options is None else _SharedPool(partial(_new_sync_pool, **options))
+
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None or self._http_client.is_closed:
+            with self._http_client_lock:
+                if self._http_client is None or self._http_client.is_closed:
+                    self._http_client = self._pool.acquire()
+        return self._http_client
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        url = self._async_client._url(endpoint)
+        request_headers = self._async_client._request_headers(headers)
+        for attempt in range(self.max_retries + 1):
+            is_last = attempt == self.max_retries
+            try:
+                response = self._get_http_client().request(
+                    method, url, headers=request_headers, **kwargs
+                )
+            except RETRYABLE_ERRORS:
+                if is_last:
+                    raise
+                time.sleep(_retry_delay(attempt))
+                continue
+            if is_last or not _should_retry(method, response):
+                break
+            time.sleep(_retry_delay(attempt, response))
+        response.raise_for_status()
+        return response.json()
+
+    def get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make a synchronous GET request"""
-        return await self._async_client.get(endpoint, params, headers)
+        return self._request("GET", endpoint, headers, params=params)
 
-    @sync_wrapper
-    async def post(
+    def post(
         self,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        content: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """Make a synchronous POST request"""
-        return await self._async_client.post(endpoint, json_data, headers)
+        return self._request(
+            "POST", endpoint, headers, timeout=_timeout_config(timeout), **_body(json_data, content)
+        )
 
-    @sync_wrapper
-    async def patch(
+    def patch(
         self,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make a synchronous PATCH request"""
-        return await self._async_client.patch(endpoint, json_data, headers)
+        return self._request("PATCH", endpoint, headers, json=json_data)
 
-    @sync_wrapper
-    async def delete(
+    def delete(
         self,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Make a synchronous DELETE request"""
-        return await self._async_client.delete(endpoint, json_data, headers)
+        return self._request(
+            "DELETE", endpoint, headers, json=json_data, timeout=_timeout_config(timeout)
+        )
+
+    def close(self) -> None:
+        """Release the shared pool, closing it if no other client is using it"""
+        with self._http_client_lock:
+            http_client, self._http_client = self._http_client, None
+        if http_client is not None and self._pool.release(http_client):
+            http_client.close()
+
+    def __enter__(self) -> "SyncRespanClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 # Convenience functions for creating clients
@@ -267,4 +658,6 @@ __all__ = [
     "SyncRespanClient",
     "create_client",
     "create_sync_client",
+    "aclose_all",
+    "close_all",
 ]
@@ -2,160 +2,180 @@
 Pytest configuration and fixtures for Respan SDK tests
 """
 
-from dotenv import load_dotenv
-
-load_dotenv(override=True)
-
 import pytest
 import os
 from unittest.mock import AsyncMock, MagicMock
-from respan.datasets.api import DatasetAPI
-from respan.evaluators.api import EvaluatorAPI
+from dotenv import load_dotenv
 
+@pytest.fixture(scope="session", autouse=True)
+def _load_env():
+    """Load .env once per test session"""
+    load_dotenv(override=True)
 
-@pytest.fixture
-def api_key():
+
+@pytest.fixture(scope="session")
+def api_key(_load_env):
     """Test API key fixture"""
     return os.getenv("RESPAN_API_KEY")
 
 
-@pytest.fixture
-def base_url():
+@pytest.fixture(scope="session")
+def base_url(_load_env):
     """Test base URL fixture"""
     return os.getenv("RESPAN_BASE_URL")
 
 
-@pytest.fixture
+# Built once at import and shared by every test; treat it as read-only
+_MOCK_RESPONSE_DATA = {
+    "dataset": {
+        "id": "test_dataset_123",
+        "name": "TEST",
+        "description": "",
+        "type": "sampling",
+        "sampling": 50,
+        "start_time": "2025-07-04T22:55:38.818Z",
+        "end_time": "2025-07-13T22:55:38.818Z",
+        "status": "ready",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+        "organization": "test_org_123",
+    },
+    "dataset_list": {
+        "results": [
+            {
+                "id": "test_dataset_123",
+                "name": "TEST",
+                "description": "",
+                "type": "sampling",
+                "status": "ready",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+                "organization": "test_org_123",
+            }
+        ],
+        "count": 1,
+        "page": 1,
+        "page_size": 10,
+        "total_pages": 1,
+    },
+    "evaluator": {
+        "id": "eval_123",
+        "name": "Character Count Evaluator",
+        "slug": "char_count_eval",
+        "description": "Counts characters in responses",
+        "type": "built_in",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    },
+    "evaluator_list": {
+        "results": [
+            {
+                "id": "eval_123",
+                "name": "Character Count Evaluator",
+                "slug": "char_count_eval",
+                "description": "Counts characters in responses",
+                "type": "built_in",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+            }
+        ],
+        "count": 1,
+        "page": 1,
+        "page_size": 10,
+        "total_pages": 1,
+    },
+    "eval_report": {
+        "id": "report_123",
+        "dataset_id": "test_dataset_123",
+        "evaluator_slugs": ["char_count_eval"],
+        "status": "completed",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+        "results": {},
+    },
+    "eval_report_list": {
+        "results": [
+            {
+                "id": "report_123",
+                "dataset_id": "test_dataset_123",
+                "evaluator_slugs": ["char_count_eval"],
+                "status": "completed",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+            }
+        ],
+        "count": 1,
+        "page": 1,
+        "page_size": 10,
+        "total_pages": 1,
+    },
+    "logs": {
+        "results": [
+            {
+                "id": "log_123",
+                "request_id": "req_123",
+                "timestamp": "2025-01-01T00:00:00Z",
+                "model": "gpt-4",
+                "prompt": "Hello",
+                "response": "Hi there!",
+            }
+        ],
+        "count": 1,
+        "page": 1,
+        "page_size": 50,
+        "total_pages": 1,
+    },
+    "log_management_response": {
+        "message": "Logs processed successfully",
+        "count": 5,
+    },
+}
+
+
+@pytest.fixture(scope="session")
 def mock_response_data():
-    """Mock response data for various API calls"""
-    return {
-        "dataset": {
-            "id": "test_dataset_123",
-            "name": "TEST",
-            "description": "",
-            "type": "sampling",
-            "sampling": 50,
-            "start_time": "2025-07-04T22:55:38.818Z",
-            "end_time": "2025-07-13T22:55:38.818Z",
-            "status": "ready",
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-01-01T00:00:00Z",
-            "organization": "test_org_123",
-        },
-        "dataset_list": {
-            "results": [
-                {
-                    "id": "test_dataset_123",
-                    "name": "TEST",
-                    "description": "",
-                    "type": "sampling",
-                    "status": "ready",
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                    "organization": "test_org_123",
-                }
-            ],
-            "count": 1,
-            "page": 1,
-            "page_size": 10,
-            "total_pages": 1,
-        },
-        "evaluator": {
-            "id": "eval_123",
-            "name": "Character Count Evaluator",
-            "slug": "char_count_eval",
-            "description": "Counts characters in responses",
-            "type": "built_in",
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-01-01T00:00:00Z",
-        },
-        "evaluator_list": {
-            "results": [
-                {
-                    "id": "eval_123",
-                    "name": "Character Count Evaluator",
-                    "slug": "char_count_eval",
-                    "description": "Counts characters in responses",
-                    "type": "built_in",
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                }
-            ],
-            "count": 1,
-            "page": 1,
-            "page_size": 10,
-            "total_pages": 1,
-        },
-        "eval_report": {
-            "id": "report_123",
-            "dataset_id": "test_dataset_123",
-            "evaluator_slugs": ["char_count_eval"],
-            "status": "completed",
-            "created_at": "2025-01-01T00:00:00Z",
-            "updated_at": "2025-01-01T00:00:00Z",
-            "results": {},
-        },
-        "eval_report_list": {
-            "results": [
-                {
-                    "id": "report_123",
-                    "dataset_id": "test_dataset_123",
-                    "evaluator_slugs": ["char_count_eval"],
-                    "status": "completed",
-                    "created_at": "2025-01-01T00:00:00Z",
-                    "updated_at": "2025-01-01T00:00:00Z",
-                }
-            ],
-            "count": 1,
-            "page": 1,
-            "page_size": 10,
-            "total_pages": 1,
-        },
-        "logs": {
-            "results": [
-                {
-                    "id": "log_123",
-                    "request_id": "req_123",
-                    "timestamp": "2025-01-01T00:00:00Z",
-                    "model": "gpt-4",
-                    "prompt": "Hello",
-                    "response": "Hi there!",
-                }
-            ],
-            "count": 1,
-            "page": 1,
-            "page_size": 50,
-            "total_pages": 1,
-        },
-        "log_management_response": {
-            "message": "Logs processed successfully",
-            "count": 5,
-        },
-    }
+    """Mock response data for various API calls (shared; do not modify)"""
+    return _MOCK_RESPONSE_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dataset_api_async(api_key, base_url):
     """Async dataset API client fixture"""
-    return DatasetAPI(api_key=api_key, base_url=base_url)
+    from respan.datasets.api import DatasetAPI
 
+    api = DatasetAPI(api_key=api_key, base_url=base_url)
+    yield api
+    api.close()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def dataset_api_sync(api_key, base_url):
     """Sync dataset API client fixture (unified API)"""
-    return DatasetAPI(api_key=api_key, base_url=base_url)
+    from respan.datasets.api import DatasetAPI
 
+    api = DatasetAPI(api_key=api_key, base_url=base_url)
+    yield api
+    api.close()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def evaluator_api_async(api_key, base_url):
     """Async evaluator API client fixture (unified API)"""
-    return EvaluatorAPI(api_key=api_key, base_url=base_url)
+    from respan.evaluators.api import EvaluatorAPI
 
+    api = EvaluatorAPI(api_key=api_key, base_url=base_url)
+    yield api
+    api.close()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def evaluator_api_sync(api_key, base_url):
     """Sync evaluator API client fixture (unified API)"""
-    return EvaluatorAPI(api_key=api_key, base_url=base_url)
+    from respan.evaluators.api import EvaluatorAPI
+
+    api = EvaluatorAPI(api_key=api_key, base_url=base_url)
+    yield api
+    api.close()
 
 
 @pytest.fixture
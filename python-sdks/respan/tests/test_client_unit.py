@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the centralized HTTP client
+
+Covers connection pool sharing and lifecycle of RespanClient /
+SyncRespanClient and the BaseAPI context managers - without making network
+calls.
+"""
+
+import asyncio
+import gc
+import json
+import threading
+import weakref
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from respan.experiments.api import ExperimentAPI
+from respan.logs.api import LogAPI
+from respan.prompts.api import PromptAPI
+from respan.types.log_types import RespanLogParams
+from respan.utils import client as client_module
+from respan.utils.client import RespanClient, SyncRespanClient
+
+
+class TestClientConnectionPool:
+    """Unit tests for pooled connection handling"""
+
+    def test_async_client_reuses_pool_within_loop(self):
+        """Test that requests on one event loop share a single AsyncClient"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+
+        async def get_pools():
+            first = client._get_http_client()
+            second = client._get_http_client()
+            await client.aclose()
+            return first, second
+
+        first, second = asyncio.run(get_pools())
+        assert first is second
+        assert first.is_closed
+
+    def test_async_client_creates_new_pool_per_loop(self):
+        """Test that a pool is not reused across loops and is closed with its loop"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+
+        async def get_pool():
+            return client._get_http_client()
+
+        first, second = asyncio.run(get_pool()), asyncio.run(get_pool())
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_shared_pools_are_dropped_with_their_loop(self):
+        """Test that asyncio.run() shutdown removes the loop's shared pool entry"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+        loops = []
+
+        async def use_pool():
+            loops.append(weakref.ref(asyncio.get_running_loop()))
+            client._get_http_client()
+            await client.aclose()
+
+        for _ in range(5):
+            asyncio.run(use_pool())
+        gc.collect()
+
+        assert all(loop() is None for loop in loops)
+        assert not any(loop.is_closed() for loop in client_module._async_pools)
+
+    def test_loop_switch_releases_old_pool(self):
+        """Test that moving to another loop closes a pool this client was the last user of"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+
+        async def get_pool():
+            return client._get_http_client()
+
+        old_loop = asyncio.new_event_loop()
+        pool = old_loop.run_until_complete(get_pool())
+
+        async def switch():
+            assert client._get_http_client() is not pool
+            await client.aclose()
+
+        asyncio.run(switch())
+        old_loop.run_until_complete(asyncio.sleep(0))  # run the scheduled close
+        assert pool.is_closed
+        closers = asyncio.all_tasks(old_loop)
+        for task in closers:
+            task.cancel()
+        old_loop.run_until_complete(asyncio.gather(*closers, return_exceptions=True))
+        old_loop.close()
+
+    def test_aclose_from_another_loop_closes_pool(self):
+        """Test that aclose() on a different loop closes the pool on its own loop"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+        owner_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=owner_loop.run_forever)
+        thread.start()
+
+        async def get_pool():
+            return client._get_http_client()
+
+        pool = asyncio.run_coroutine_threadsafe(get_pool(), owner_loop).result()
+        asyncio.run(client.aclose())
+        assert pool.is_closed
+
+        owner_loop.call_soon_threadsafe(owner_loop.stop)
+        thread.join()
+        owner_loop.close()
+
+    def test_sync_client_reuses_pool(self):
+        """Test that the sync client keeps one httpx.Client until closed"""
+        client = SyncRespanClient(api_key="test-key", base_url="http://test.com")
+        pool = client._get_http_client()
+        assert client._get_http_client() is pool
+
+        client.close()
+        assert pool.is_closed
+        assert client._get_http_client() is not pool
+        client.close()
+
+    def test_sync_client_keeps_base_url_and_headers(self):
+        """Test that the sync client resolves URLs and headers like the async one"""
+        client = SyncRespanClient(api_key="test-key", base_url="http://test.com/")
+        assert client._async_client._url("/experiments/list") == "http://test.com/experiments/list"
+        headers = client._async_client._request_headers({"X-Extra": "1"})
+        assert headers["Authorization"] == "Bearer test-key"
+        assert headers["X-Extra"] == "1"
+
+    def test_async_clients_share_pool_until_last_release(self):
+        """Test that clients on one loop share a pool closed by its last user"""
+        first = RespanClient(api_key="key-1", base_url="http://test.com")
+        second = RespanClient(api_key="key-2", base_url="http://other.com")
+
+        async def share():
+            pool = first._get_http_client()
+            assert second._get_http_client() is pool
+            await first.aclose()
+            still_open = not pool.is_closed
+            await second.aclose()
+            return pool, still_open
+
+        pool, still_open = asyncio.run(share())
+        assert still_open
+        assert pool.is_closed
+
+    def test_sync_clients_share_pool_until_last_release(self):
+        """Test that sync clients share one pool closed by its last user"""
+        first = SyncRespanClient(api_key="key-1", base_url="http://test.com")
+        second = SyncRespanClient(api_key="key-2", base_url="http://other.com")
+        pool = first._get_http_client()
+        assert second._get_http_client() is pool
+
+        first.close()
+        assert not pool.is_closed
+        second.close()
+        assert pool.is_closed
+
+    def test_close_all_closes_shared_sync_pool(self):
+        """Test that close_all() closes the pool even while clients still hold it"""
+        first = SyncRespanClient(api_key="key-1", base_url="http://test.com")
+        second = SyncRespanClient(api_key="key-2", base_url="http://test.com")
+        pool = first._get_http_client()
+        second._get_http_client()
+
+        client_module.close_all()
+        assert pool.is_closed
+        new_pool = first._get_http_client()
+        assert new_pool is not pool
+        first.close()
+        second.close()
+        assert new_pool.is_closed
+
+    @pytest.mark.asyncio
+    async def test_aclose_all_closes_shared_async_pool(self):
+        """Test that aclose_all() closes the running loop's shared pool"""
+        client = RespanClient(api_key="test-key", base_url="http://test.com")
+        pool = client._get_http_client()
+        await client_module.aclose_all()
+        assert pool.is_closed
+        assert client._get_http_client() is not pool
+        await client.aclose()
+
+    def test_pool_options_give_dedicated_pool(self):
+        """Test that clients built with limits do not join the shared pool"""
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        shared = SyncRespanClient(api_key="test-key", base_url="http://test.com")
+        tuned = SyncRespanClient(api_key="test-key", base_url="http://test.com", limits=limits)
+        assert tuned._get_http_client() is not shared._get_http_client()
+
+        tuned.close()
+        assert not shared._get_http_client().is_closed
+        shared.close()
+
+    @pytest.mark.asyncio
+    async def test_transport_serves_sync_and_async_requests(self):
+        """Test that a transport passed to the API handles both clients' requests"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"path": request.url.path}))
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com", transport=transport)
+
+        assert api.sync_client.get("sync") == {"path": "/sync"}
+        assert await api.async_client.get("async") == {"path": "/async"}
+        await api.aclose()
+
+    @pytest.mark.skipif(client_module.HTTP2_ENABLED, reason="h2 is installed")
+    def test_http2_without_h2_raises(self):
+        """Test that forcing HTTP/2 without the h2 extra fails at construction"""
+        with pytest.raises(ImportError, match="h2"):
+            ExperimentAPI(api_key="test-key", base_url="http://test.com", http2=True)
+
+    @pytest.mark.parametrize("factory_name", ["_new_async_pool", "_new_sync_pool"])
+    def test_http2_follows_h2_availability(self, factory_name, monkeypatch):
+        """Test that pools enable HTTP/2 only when the h2 extra is installed"""
+        created = []
+        monkeypatch.setattr(client_module.httpx, "AsyncClient", lambda **kw: created.append(kw))
+        monkeypatch.setattr(client_module.httpx, "Client", lambda **kw: created.append(kw))
+
+        getattr(client_module, factory_name)()
+
+        assert created[0]["http2"] is client_module.HTTP2_ENABLED
+        assert created[0]["limits"] is client_module.DEFAULT_LIMITS
+
+class TestBaseAPI:
+    """Unit tests for BaseAPI helpers and context managers"""
+
+    def test_sync_context_manager_closes_pool(self):
+        """Test that leaving a with block closes the sync pool"""
+        with ExperimentAPI(api_key="test-key", base_url="http://test.com") as api:
+            pool = api.sync_client._get_http_client()
+        assert pool.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_pool(self):
+        """Test that leaving an async with block closes the async pool"""
+        async with ExperimentAPI(api_key="test-key", base_url="http://test.com") as api:
+            pool = api.client._get_http_client()
+        assert pool.is_closed
+
+
+    @pytest.mark.parametrize(
+        "page, page_size, filters, expected",
+        [
+            (None, None, {}, {}),
+            (2, None, {}, {"page": 2}),
+            (1, 50, {"status": "ready"}, {"page": 1, "page_size": 50, "status": "ready"}),
+        ],
+    )
+    def test_list_params(self, page, page_size, filters, expected):
+        """Test that only the given pagination values and filters are sent"""
+        assert ExperimentAPI._list_params(page, page_size, **filters) == expected
+
+    @pytest.mark.asyncio
+    async def test_aget_many_keeps_order_and_errors(self, monkeypatch):
+        """Test that aget_many fans out with bounded concurrency, in input order"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        in_flight = []
+        peak = []
+
+        async def fake_aget(resource_id):
+            in_flight.append(resource_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(resource_id)
+            if resource_id == "missing":
+                raise KeyError(resource_id)
+            return f"experiment-{resource_id}"
+
+        monkeypatch.setattr(api, "aget", fake_aget)
+        results = await api.aget_many(["1", "missing", "2", "3"], max_concurrency=2)
+        assert results[0] == "experiment-1"
+        assert isinstance(results[1], KeyError)
+        assert results[2:] == ["experiment-2", "experiment-3"]
+        assert max(peak) == 2
+
+    def test_get_many_sync(self, monkeypatch):
+        """Test that get_many returns per-ID results from the thread pool"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        monkeypatch.setattr(api, "get", lambda resource_id: f"experiment-{resource_id}")
+        assert api.get_many(["1", "2"]) == ["experiment-1", "experiment-2"]
+
+    @pytest.mark.asyncio
+    async def test_aupdate_and_adelete_many(self, monkeypatch):
+        """Test that update/delete fan-out pass each ID (and data) through"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+
+        async def fake_aupdate(resource_id, update_data):
+            return (resource_id, update_data["name"])
+
+        async def fake_adelete(resource_id):
+            return {"deleted": resource_id}
+
+        monkeypatch.setattr(api, "aupdate", fake_aupdate)
+        monkeypatch.setattr(api, "adelete", fake_adelete)
+        assert await api.aupdate_many({"1": {"name": "a"}, "2": {"name": "b"}}) == [("1", "a"), ("2", "b")]
+        assert await api.adelete_many(["1", "2"]) == [{"deleted": "1"}, {"deleted": "2"}]
+
+    def test_update_and_delete_many_sync(self, monkeypatch):
+        """Test the thread-pool variants accept ID/data pairs and ID lists"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        monkeypatch.setattr(api, "update", lambda resource_id, update_data: resource_id)
+        monkeypatch.setattr(api, "delete", lambda resource_id: {"deleted": resource_id})
+        assert api.update_many([("1", {}), ("2", {})]) == ["1", "2"]
+        assert api.delete_many(["1"]) == [{"deleted": "1"}]
+
+    @staticmethod
+    def _paged_list(total, requested, max_page_size=None):
+        """list()/alist() stand-ins serving `total` numbered items in pages of at most `max_page_size`"""
+
+        def page(page=1, page_size=100, **filters):
+            requested.append(page)
+            page_size = min(page_size, max_page_size or page_size)
+            start = (page - 1) * page_size
+            results = list(range(start, min(start + page_size, total)))
+            has_next = start + page_size < total
+            return SimpleNamespace(results=results, count=total, next="more" if has_next else None)
+
+        async def apage(**kwargs):
+            await asyncio.sleep(0)
+            return page(**kwargs)
+
+        return page, apage
+
+    @pytest.mark.asyncio
+    async def test_aiter_all_prefetches_pages(self, monkeypatch):
+        """Test that aiter_all yields every item in order across pages"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        requested = []
+        monkeypatch.setattr(api, "alist", self._paged_list(23, requested)[1])
+        items = [item async for item in api.aiter_all(page_size=5, prefetch=3)]
+        assert items == list(range(23))
+        assert sorted(requested) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_aiter_all_follows_server_page_size_cap(self, monkeypatch):
+        """Test that aiter_all counts pages by the size the server serves, like iter_all"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        page, apage = self._paged_list(23, [], max_page_size=5)
+        monkeypatch.setattr(api, "list", page)
+        monkeypatch.setattr(api, "alist", apage)
+        items = [item async for item in api.aiter_all(page_size=50)]
+        assert items == list(api.iter_all(page_size=50)) == list(range(23))
+
+    @pytest.mark.asyncio
+    async def test_aiter_all_cancels_prefetch_on_early_exit(self, monkeypatch):
+        """Test that breaking out early does not leave page requests running"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        requested = []
+        monkeypatch.setattr(api, "alist", self._paged_list(100, requested)[1])
+        iterator = api.aiter_all(page_size=5, prefetch=2)
+        async for item in iterator:
+            if item == 6:
+                break
+        await iterator.aclose()
+        assert max(requested) <= 4
+
+    def test_iter_all_sync(self, monkeypatch):
+        """Test that iter_all follows pages until there is no next page"""
+        api = ExperimentAPI(api_key="test-key", base_url="http://test.com")
+        requested = []
+        monkeypatch.setattr(api, "list", self._paged_list(12, requested)[0])
+        assert list(api.iter_all(page_size=5)) == list(range(12))
+        assert requested == [1, 2, 3]
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Route the shared sync pool through a MockTransport that records requests"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"message": "log successful"})
+
+    pool = client_module._SharedPool(lambda: httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(client_module, "_sync_pool", pool)
+    return requests
+
+
+class TestRequestBody:
+    """Unit tests for how request bodies are sent"""
+
+    def test_post_sends_preserialized_content(self, sent_requests):
+        """Test that content= bytes are sent as-is with the JSON content type"""
+        with SyncRespanClient(api_key="test-key", base_url="http://test.com") as client:
+            client.post("request-logs/create", content=b'{"a":1}')
+        assert sent_requests[0].content == b'{"a":1}'
+        assert sent_requests[0].headers["Content-Type"] == "application/json"
+
+    def test_log_create_body_matches_model_dump(self, sent_requests):
+        """Test that LogAPI.create sends the same JSON as model_dump(mode="json")"""
+        log_data = {"model": "gpt-4", "input": "hi", "output": "hello", "status_code": 200}
+        with LogAPI(api_key="test-key", base_url="http://test.com") as api:
+            api.create(log_data)
+        expected = RespanLogParams(**log_data).model_dump(exclude_none=True, mode="json")
+        assert json.loads(sent_requests[0].content) == expected
+
+    @pytest.mark.asyncio
+    async def test_partial_version_update_sends_only_given_fields(self):
+        """Test that aupdate_version PATCHes just the fields passed, not model defaults"""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json={"version": 1})
+
+        partial_update = {"temperature": 0.9, "max_tokens": 2000, "description": "Updated!"}
+        api = PromptAPI(
+            api_key="test-key", base_url="http://test.com", transport=httpx.MockTransport(handler)
+        )
+        await api.aupdate_version("prompt-123", 1, partial_update)
+        await api.aclose()
+
+        assert sent[0].method == "PATCH"
+        assert json.loads(sent[0].content) == partial_update
+
+
+@pytest.fixture
+def scripted_responses(monkeypatch):
+    """
+    Serve queued responses from a MockTransport for both sync and async pools
+
+    Returns the queue (append httpx.Response objects or exceptions) and the
+    list of requests received. Retry sleeps are recorded instead of slept.
+    """
+    queue, received, sleeps = [], [], []
+
+    def handler(request):
+        received.append(request)
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        client_module, "_sync_pool",
+        client_module._SharedPool(lambda: httpx.Client(transport=transport)),
+    )
+    monkeypatch.setattr(client_module, "_async_pools", client_module.weakref.WeakKeyDictionary())
+    monkeypatch.setattr(client_module, "_new_async_pool", lambda: httpx.AsyncClient(transport=transport))
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+
+    async def fake_async_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_async_sleep)
+    return queue, received, sleeps
+
+
+class TestRetries:
+    """Unit tests for retrying transient failures"""
+
+    def test_retries_503_then_succeeds(self, scripted_responses):
+        """Test that a 503 is retried and the later success is returned"""
+        queue, received, sleeps = scripted_responses
+        queue += [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        with SyncRespanClient(api_key="test-key", base_url="http://test.com") as client:
+            assert client.post("request-logs/create", json_data={}) == {"ok": True}
+        assert len(received) == 2
+        assert len(sleeps) == 1
+
+    def test_honours_retry_after(self, scripted_responses):
+        """Test that a 429 Retry-After header sets the backoff delay"""
+        queue, _, sleeps = scripted_responses
+        queue += [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200, json={})]
+        with SyncRespanClient(api_key="test-key", base_url="http://test.com") as client:
+            client.get("experiments/list")
+        assert sleeps == [7.0]
+
+    def test_post_502_is_not_retried(self, scripted_responses):
+        """Test that an ambiguous gateway error does not resend a POST"""
+        queue, received, _ = scripted_responses
+        queue += [httpx.Response(502)]
+        with SyncRespanClient(api_key="test-key", base_url="http://test.com") as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.post("request-logs/create", json_data={})
+        assert len(received) == 1
+
+    def test_gives_up_after_max_retries(self, scripted_responses):
+        """Test that the final failure is raised once retries are exhausted"""
+        queue, received, _ = scripted_responses
+        queue += [httpx.Response(503)] * 3
+        with SyncRespanClient(api_key="test-key", base_url="http://test.com") as client:
+            client.max_retries = 2
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get("experiments/list")
+        assert len(received) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_retries_connect_error(self, scripted_responses):
+        """Test that the async client resends after a connection failure"""
+        queue, received, sleeps = scripted_responses
+        queue += [httpx.ConnectError("refused"), httpx.Response(200, json={"ok": True})]
+        async with RespanClient(api_key="test-key", base_url="http://test.com") as client:
+            assert await client.get("experiments/list") == {"ok": True}
+        assert len(received) == 2
+        assert len(sleeps) == 1
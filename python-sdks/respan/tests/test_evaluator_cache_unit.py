@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the EvaluatorAPI response cache
+
+The HTTP client's get() is replaced by a counting stub so no network calls are
+made.
+"""
+
+import pytest
+from respan.evaluators.api import EvaluatorAPI
+
+
+@pytest.fixture
+def evaluator_api(mock_response_data):
+    """EvaluatorAPI whose sync and async clients count GET requests"""
+    api = EvaluatorAPI(api_key="test-key", base_url="http://test.com")
+    api.requests = []
+
+    def respond(endpoint, params=None):
+        api.requests.append((endpoint, params))
+        if endpoint.endswith("/"):
+            return mock_response_data["evaluator_list"]
+        return mock_response_data["evaluator"]
+
+    async def async_respond(endpoint, params=None):
+        return respond(endpoint, params)
+
+    api.sync_client.get = respond
+    api.client.get = async_respond
+    return api
+
+
+class TestEvaluatorCache:
+    """Unit tests for caching read-only evaluator responses"""
+
+    def test_get_is_cached(self, evaluator_api):
+        """Test that repeated get() calls for one evaluator hit the network once"""
+        first = evaluator_api.get("char_count_eval")
+        assert evaluator_api.get("char_count_eval") is first
+        evaluator_api.get("other_eval")
+        assert len(evaluator_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_and_sync_share_cache(self, evaluator_api):
+        """Test that aget() reuses a response cached by get()"""
+        evaluator = evaluator_api.get("char_count_eval")
+        assert await evaluator_api.aget("char_count_eval") is evaluator
+        assert len(evaluator_api.requests) == 1
+
+    def test_list_cached_per_params(self, evaluator_api):
+        """Test that list() responses are keyed on their query parameters"""
+        evaluator_api.list(page=1, type="built_in")
+        evaluator_api.list(type="built_in", page=1)
+        evaluator_api.list(page=2, type="built_in")
+        assert len(evaluator_api.requests) == 2
+
+    def test_entries_expire(self, evaluator_api, monkeypatch):
+        """Test that entries older than cache_ttl are fetched again"""
+        import respan.evaluators.api as evaluator_module
+
+        now = [1000.0]
+        monkeypatch.setattr(evaluator_module.time, "monotonic", lambda: now[0])
+        evaluator_api.get("char_count_eval")
+        now[0] += evaluator_api.cache_ttl
+        evaluator_api.get("char_count_eval")
+        assert len(evaluator_api.requests) == 2
+
+    def test_invalidate(self, evaluator_api):
+        """Test that invalidate() drops one evaluator or the whole cache"""
+        evaluator_api.get("char_count_eval")
+        evaluator_api.get("other_eval")
+        evaluator_api.invalidate("char_count_eval")
+        evaluator_api.get("other_eval")
+        evaluator_api.get("char_count_eval")
+        assert len(evaluator_api.requests) == 3
+
+        evaluator_api.invalidate()
+        evaluator_api.get("other_eval")
+        assert len(evaluator_api.requests) == 4
+
+    def test_cache_can_be_disabled(self, mock_response_data):
+        """Test that cache_ttl=0 sends every request"""
+        api = EvaluatorAPI(api_key="test-key", base_url="http://test.com", cache_ttl=0)
+        calls = []
+        api.sync_client.get = lambda endpoint, params=None: calls.append(endpoint) or mock_response_data["evaluator"]
+        api.get("char_count_eval")
+        api.get("char_count_eval")
+        assert len(calls) == 2
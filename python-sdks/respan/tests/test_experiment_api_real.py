@@ -2,8 +2,12 @@
 """
 Experiment API Real Integration Tests
 
-These tests use real API calls to validate experiment functionality.
-No mocking - tests actual SDK behavior with Respan server.
+These tests use real API calls to validate experiment functionality
+against a Respan server.
+
+Without RESPAN_API_KEY (or with RESPAN_USE_MOCK=1) the same tests run against
+an in-process mock of the experiment endpoints instead, so they finish in
+milliseconds. Network runs are marked ``integration``.
 
 Environment variables required:
 - RESPAN_API_KEY
@@ -11,10 +15,17 @@ Environment variables required:
 
 Usage:
     python -m pytest tests/test_experiment_api_real.py -v -s
+
+    # Against a live server, spread the classes over workers (pytest-xdist)
+    python -m pytest tests/test_experiment_api_real.py -n 4 --dist=loadscope
 """
 
-import pytest
+import json
 import os
+import uuid
+
+import httpx
+import pytest
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -37,28 +48,118 @@ from respan.types.experiment_types import (
 )
 
 
-@pytest.fixture
+USE_MOCK = (
+    os.getenv("RESPAN_USE_MOCK", "").lower() in ("1", "true", "yes")
+    or not os.getenv("RESPAN_API_KEY")
+)
+pytestmark = [] if USE_MOCK else [pytest.mark.integration]
+
+
+class MockExperimentServer:
+    """In-memory stand-in for the experiment endpoints, used as an httpx.MockTransport handler"""
+
+    def __init__(self):
+        self.experiments = {}
+        self._next_id = 0
+
+    def _new_id(self, prefix: str) -> str:
+        self._next_id += 1
+        return f"{prefix}_{self._next_id}"
+
+    def _with_ids(self, items, prefix):
+        return [{**item, "id": item.get("id") or self._new_id(prefix)} for item in items]
+
+    def _replace(self, items, updates):
+        updates = {item["id"]: item for item in updates}
+        return [{**item, **updates.get(item["id"], {})} for item in items]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.strip("/").split("/")[2:]  # drop "api/experiments"
+        body = json.loads(request.content) if request.content else {}
+        method = request.method
+
+        if parts == ["create"] and method == "POST":
+            experiment = {
+                "id": self._new_id("experiment"),
+                "name": body["name"],
+                "description": body.get("description", ""),
+                "columns": self._with_ids(body.get("columns", []), "column"),
+                "rows": self._with_ids(body.get("rows", []), "row"),
+            }
+            self.experiments[experiment["id"]] = experiment
+            return httpx.Response(201, json=experiment)
+        if parts == ["list"] and method == "GET":
+            page = int(request.url.params.get("page", 1))
+            page_size = int(request.url.params.get("page_size", 20))
+            experiments = list(self.experiments.values())
+            results = experiments[(page - 1) * page_size : page * page_size]
+            return httpx.Response(200, json={"results": results, "count": len(experiments)})
+
+        experiment = self.experiments.get(parts[0]) if parts else None
+        if experiment is None:
+            return httpx.Response(404, json={"detail": "Not found."})
+        action = parts[1] if len(parts) > 1 else None
+
+        if action is None and method == "GET":
+            return httpx.Response(200, json=experiment)
+        if action is None and method == "PATCH":
+            experiment.update(body)
+            return httpx.Response(200, json=experiment)
+        if action is None and method == "DELETE":
+            del self.experiments[experiment["id"]]
+            return httpx.Response(200, json={"message": "Experiment deleted"})
+        if action in ("rows", "columns"):
+            items = experiment[action]
+            if method == "POST":
+                experiment[action] = items + self._with_ids(body[action], action[:-1])
+            elif method == "PATCH":
+                experiment[action] = self._replace(items, body[action])
+            elif method == "DELETE":
+                experiment[action] = [item for item in items if item["id"] not in body[action]]
+            return httpx.Response(200, json={"message": f"{action.capitalize()} {method.lower()} successful"})
+        if action in ("run", "run-evals") and method == "POST":
+            return httpx.Response(
+                202, json={"message": "Experiment run started", "experiment_id": experiment["id"]}
+            )
+        return httpx.Response(405, json={"detail": f"Method {method} not allowed."})
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Get API key from environment"""
-    key = os.getenv("RESPAN_API_KEY")
-    if not key:
-        pytest.skip("RESPAN_API_KEY not found in environment")
-    return key
+    # USE_MOCK is on whenever RESPAN_API_KEY is unset
+    return "test-key" if USE_MOCK else os.getenv("RESPAN_API_KEY")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_url():
     """Get base URL from environment"""
+    if USE_MOCK:
+        return "http://respan.mock"
     return os.getenv("RESPAN_BASE_URL", "http://localhost:8000")
 
 
-@pytest.fixture
-def experiment_api(api_key, base_url):
-    """Experiment API client"""
-    return ExperimentAPI(api_key=api_key, base_url=base_url)
+@pytest.fixture(scope="session")
+def mock_transport():
+    """MockTransport serving the experiment endpoints, or None for real API runs"""
+    return httpx.MockTransport(MockExperimentServer()) if USE_MOCK else None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+async def experiment_api(api_key, base_url, mock_transport):
+    """Experiment API client shared by the whole session"""
+    # Keep every connection alive between tests instead of the default 20
+    limits = httpx.Limits(
+        max_connections=100, max_keepalive_connections=100, keepalive_expiry=30
+    )
+    api = ExperimentAPI(
+        api_key=api_key, base_url=base_url, limits=limits, transport=mock_transport
+    )
+    yield api
+    await api.aclose()
+
+
+@pytest.fixture(scope="session")
 def test_column():
     """Sample experiment column for testing"""
     return ExperimentColumnType(
@@ -85,7 +186,7 @@ def test_column():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_row():
     """Sample experiment row for testing"""
     return ExperimentRowType(
@@ -94,50 +195,113 @@ def test_row():
     )
 
 
-class TestExperimentAPICRUD:
-    """Test basic CRUD operations for experiments"""
-    
-    def test_create_experiment_sync(self, experiment_api, test_column, test_row):
-        """Test creating an experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Experiment_{timestamp}",
+@pytest.fixture(scope="session")
+def name_prefix():
+    """Name prefix shared by every experiment of this session"""
+    return f"SDK_TEST_{datetime.now():%Y%m%d_%H%M%S}"
+
+
+@pytest.fixture(scope="session")
+def unique_name(name_prefix):
+    """Build experiment names that stay unique across tests and pytest-xdist workers"""
+    return lambda label: f"{name_prefix}_{label}_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+async def cleanup_registry(experiment_api):
+    """IDs of experiments to delete, all at once, when the session ends"""
+    experiment_ids = []
+    yield experiment_ids
+    await experiment_api.adelete_many(experiment_ids)
+
+
+async def _create_experiment(experiment_api, cleanup_registry, name, test_column, test_row):
+    """Create an experiment with one column and one row, registered for cleanup"""
+    experiment = await experiment_api.acreate(
+        ExperimentCreate(
+            name=name,
             description="Integration test experiment created by SDK",
             columns=[test_column],
-            rows=[test_row]
+            rows=[test_row],
         )
-        
-        # Create experiment
-        experiment = experiment_api.create(experiment_data)
-        
-        # Validate response
-        assert experiment.id is not None
-        assert experiment.name == experiment_data.name
-        assert experiment.description == experiment_data.description
-        assert len(experiment.columns) == 1
-        assert len(experiment.rows) == 1
-        
-        # Store for cleanup
-        self.created_experiment_id = experiment.id
-        
-        # Clean up
-        experiment_api.delete(experiment.id)
+    )
+    cleanup_registry.append(experiment.id)
+    return experiment
 
-    @pytest.mark.asyncio
-    async def test_create_experiment_async(self, experiment_api, test_column, test_row):
-        """Test creating an experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+
+@pytest.fixture
+async def created_experiment(
+    request, experiment_api, cleanup_registry, unique_name, test_column, test_row
+):
+    """Throwaway experiment for tests that modify it"""
+    return await _create_experiment(
+        experiment_api, cleanup_registry, unique_name(request.node.originalname), test_column, test_row
+    )
+
+
+@pytest.fixture(scope="session")
+async def shared_experiment(experiment_api, cleanup_registry, unique_name, test_column, test_row):
+    """Experiment created once per session for tests that only read it - do not modify"""
+    return await _create_experiment(
+        experiment_api, cleanup_registry, unique_name("Shared"), test_column, test_row
+    )
+
+
+async def call(experiment_api, mode, method, *args):
+    """Call ``method`` on the API, or await its ``a``-prefixed async twin"""
+    if mode == "sync":
+        return getattr(experiment_api, method)(*args)
+    return await getattr(experiment_api, f"a{method}")(*args)
+
+
+def sample_column(name: str, temperature: float) -> ExperimentColumnType:
+    """Second GPT-4 column added on top of test_column"""
+    return ExperimentColumnType(
+        model="gpt-4",
+        name=name,
+        temperature=temperature,
+        max_completion_tokens=300,
+        top_p=1.0,
+        frequency_penalty=0.0,
+        presence_penalty=0.0,
+        prompt_messages=[
+            {
+                "role": "system",
+                "content": "You are an expert assistant for SDK testing."
+            },
+            {
+                "role": "user",
+                "content": "{{user_input}}"
+            }
+        ],
+        tools=[],
+        tool_choice="auto",
+        response_format={"type": "text"}
+    )
+
+
+MODES = pytest.mark.parametrize("mode", ["sync", "async"])
+
+
+class TestExperimentAPICRUD:
+    """Test basic CRUD operations for experiments"""
+
+    @MODES
+    async def test_create_and_delete_experiment(
+        self, mode, experiment_api, cleanup_registry, unique_name, test_column, test_row
+    ):
+        """Test creating an experiment, then deleting it"""
         experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_Experiment_{timestamp}",
-            description="Async integration test experiment created by SDK",
+            name=unique_name(f"{mode}_Experiment"),
+            description=f"{mode} integration test experiment created by SDK",
             columns=[test_column],
             rows=[test_row]
         )
         
         # Create experiment
-        experiment = await experiment_api.acreate(experiment_data)
+        experiment = await call(experiment_api, mode, "create", experiment_data)
+        # Deleted at session end if an assertion below fails first
+        cleanup_registry.append(experiment.id)
         
         # Validate response
         assert experiment.id is not None
@@ -145,512 +309,147 @@ class TestExperimentAPICRUD:
         assert experiment.description == experiment_data.description
         assert len(experiment.columns) == 1
         assert len(experiment.rows) == 1
-        
-        # Clean up
-        await experiment_api.adelete(experiment.id)
 
-    def test_list_experiments_sync(self, experiment_api):
-        """Test listing experiments synchronously"""
-        # List experiments
-        experiments = experiment_api.list(page=1, page_size=5)
-        
-        # Validate response structure
-        assert hasattr(experiments, 'experiments')
-        assert hasattr(experiments, 'total')
-        assert hasattr(experiments, 'page')
-        assert hasattr(experiments, 'page_size')
-        assert isinstance(experiments.experiments, list)
-        assert isinstance(experiments.total, int)
-
-    @pytest.mark.asyncio
-    async def test_list_experiments_async(self, experiment_api):
-        """Test listing experiments asynchronously"""
+        # Delete experiment
+        await call(experiment_api, mode, "delete", experiment.id)
+        cleanup_registry.remove(experiment.id)
+
+    @MODES
+    async def test_list_experiments(self, mode, experiment_api):
+        """Test listing experiments"""
         # List experiments
-        experiments = await experiment_api.alist(page=1, page_size=5)
+        experiments = await call(experiment_api, mode, "list", 1, 5)
         
         # Validate response structure
-        assert hasattr(experiments, 'experiments')
-        assert hasattr(experiments, 'total')
-        assert hasattr(experiments, 'page')
-        assert hasattr(experiments, 'page_size')
-        assert isinstance(experiments.experiments, list)
-        assert isinstance(experiments.total, int)
-
-    def test_get_experiment_sync(self, experiment_api, test_column, test_row):
-        """Test retrieving a specific experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Get_{timestamp}",
-            description="Test experiment for get operation",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        created_experiment = experiment_api.create(experiment_data)
-        
-        try:
-            # Get experiment
-            retrieved_experiment = experiment_api.get(created_experiment.id)
-            
-            # Validate response
-            assert retrieved_experiment.id == created_experiment.id
-            assert retrieved_experiment.name == created_experiment.name
-            assert retrieved_experiment.description == created_experiment.description
-            
-        finally:
-            # Clean up
-            experiment_api.delete(created_experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_get_experiment_async(self, experiment_api, test_column, test_row):
-        """Test retrieving a specific experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_Get_{timestamp}",
-            description="Async test experiment for get operation",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        created_experiment = await experiment_api.acreate(experiment_data)
-        
-        try:
-            # Get experiment
-            retrieved_experiment = await experiment_api.aget(created_experiment.id)
-            
-            # Validate response
-            assert retrieved_experiment.id == created_experiment.id
-            assert retrieved_experiment.name == created_experiment.name
-            assert retrieved_experiment.description == created_experiment.description
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(created_experiment.id)
-
-    def test_update_experiment_sync(self, experiment_api, test_column, test_row):
-        """Test updating an experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        assert isinstance(experiments.results, list)
+        assert isinstance(experiments.count, int)
+        assert len(experiments.results) <= 5
+
+    @MODES
+    async def test_get_experiment(self, mode, experiment_api, shared_experiment):
+        """Test retrieving a specific experiment"""
+        retrieved_experiment = await call(experiment_api, mode, "get", shared_experiment.id)
         
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Update_{timestamp}",
-            description="Test experiment for update operation",
-            columns=[test_column],
-            rows=[test_row]
+        # Validate response
+        assert retrieved_experiment.id == shared_experiment.id
+        assert retrieved_experiment.name == shared_experiment.name
+        assert retrieved_experiment.description == shared_experiment.description
+
+    @MODES
+    async def test_update_experiment(self, mode, experiment_api, created_experiment, unique_name):
+        """Test updating an experiment"""
+        update_data = ExperimentUpdate(
+            name=unique_name(f"{mode}_Updated"),
+            description=f"{mode} updated description for test experiment"
         )
-        created_experiment = experiment_api.create(experiment_data)
-        
-        try:
-            # Update experiment
-            update_data = ExperimentUpdate(
-                name=f"SDK_TEST_Updated_{timestamp}",
-                description="Updated description for test experiment"
-            )
-            updated_experiment = experiment_api.update(created_experiment.id, update_data)
-            
-            # Validate response
-            assert updated_experiment.id == created_experiment.id
-            assert updated_experiment.name == update_data.name
-            assert updated_experiment.description == update_data.description
-            
-        finally:
-            # Clean up
-            experiment_api.delete(created_experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_update_experiment_async(self, experiment_api, test_column, test_row):
-        """Test updating an experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_Update_{timestamp}",
-            description="Async test experiment for update operation",
-            columns=[test_column],
-            rows=[test_row]
+        updated_experiment = await call(
+            experiment_api, mode, "update", created_experiment.id, update_data
         )
-        created_experiment = await experiment_api.acreate(experiment_data)
         
-        try:
-            # Update experiment
-            update_data = ExperimentUpdate(
-                name=f"SDK_TEST_Async_Updated_{timestamp}",
-                description="Async updated description for test experiment"
-            )
-            updated_experiment = await experiment_api.aupdate(created_experiment.id, update_data)
-            
-            # Validate response
-            assert updated_experiment.id == created_experiment.id
-            assert updated_experiment.name == update_data.name
-            assert updated_experiment.description == update_data.description
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(created_experiment.id)
+        # Validate response
+        assert updated_experiment.id == created_experiment.id
+        assert updated_experiment.name == update_data.name
+        assert updated_experiment.description == update_data.description
 
 
 class TestExperimentRowManagement:
     """Test row management operations"""
-    
-    def test_add_rows_sync(self, experiment_api, test_column, test_row):
-        """Test adding rows to an experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_AddRows_{timestamp}",
-            description="Test experiment for adding rows",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = experiment_api.create(experiment_data)
+
+    @MODES
+    async def test_add_rows(self, mode, experiment_api, created_experiment):
+        """Test adding rows to an experiment"""
+        new_rows = [
+            ExperimentRowType(
+                input={"user_input": "What is 3+3?"},
+                ideal_output="6"
+            ),
+            ExperimentRowType(
+                input={"user_input": "What is the capital of France?"},
+                ideal_output="Paris"
+            )
+        ]
         
-        try:
-            # Add more rows
-            new_rows = [
-                ExperimentRowType(
-                    input={"user_input": "What is 3+3?"},
-                    ideal_output="6"
-                ),
-                ExperimentRowType(
-                    input={"user_input": "What is the capital of France?"},
-                    ideal_output="Paris"
-                )
-            ]
-            
-            add_request = AddExperimentRowsRequest(rows=new_rows)
-            result = experiment_api.add_rows(experiment.id, add_request)
-            
-            # Validate response
-            assert "message" in result
-            
-            # Verify rows were added by getting the experiment
-            updated_experiment = experiment_api.get(experiment.id)
-            assert len(updated_experiment.rows) == 3  # Original 1 + 2 new
-            
-        finally:
-            # Clean up
-            experiment_api.delete(experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_add_rows_async(self, experiment_api, test_column, test_row):
-        """Test adding rows to an experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        add_request = AddExperimentRowsRequest(rows=new_rows)
+        result = await call(experiment_api, mode, "add_rows", created_experiment.id, add_request)
         
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_AddRows_{timestamp}",
-            description="Async test experiment for adding rows",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = await experiment_api.acreate(experiment_data)
+        # Validate response
+        assert "message" in result
         
-        try:
-            # Add more rows
-            new_rows = [
-                ExperimentRowType(
-                    input={"user_input": "What is 5+5?"},
-                    ideal_output="10"
-                )
-            ]
-            
-            add_request = AddExperimentRowsRequest(rows=new_rows)
-            result = await experiment_api.aadd_rows(experiment.id, add_request)
-            
-            # Validate response
-            assert "message" in result
-            
-            # Verify rows were added
-            updated_experiment = await experiment_api.aget(experiment.id)
-            assert len(updated_experiment.rows) == 2  # Original 1 + 1 new
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(experiment.id)
+        # Verify rows were added by getting the experiment
+        updated_experiment = await call(experiment_api, mode, "get", created_experiment.id)
+        assert len(updated_experiment.rows) == 3  # Original 1 + 2 new
 
 
 class TestExperimentColumnManagement:
     """Test column management operations"""
-    
-    def test_add_columns_sync(self, experiment_api, test_column, test_row):
-        """Test adding columns to an experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_AddColumns_{timestamp}",
-            description="Test experiment for adding columns",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = experiment_api.create(experiment_data)
+
+    @MODES
+    async def test_add_columns(self, mode, experiment_api, created_experiment):
+        """Test adding columns to an experiment"""
+        new_column = sample_column(f"SDK Test {mode} GPT-4 Column", temperature=0.3)
         
-        try:
-            # Add more columns
-            new_column = ExperimentColumnType(
-                model="gpt-4",
-                name="SDK Test GPT-4 Column",
-                temperature=0.3,
-                max_completion_tokens=300,
-                top_p=1.0,
-                frequency_penalty=0.0,
-                presence_penalty=0.0,
-                prompt_messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert assistant for SDK testing."
-                    },
-                    {
-                        "role": "user",
-                        "content": "{{user_input}}"
-                    }
-                ],
-                tools=[],
-                tool_choice="auto",
-                response_format={"type": "text"}
-            )
-            
-            add_request = AddExperimentColumnsRequest(columns=[new_column])
-            result = experiment_api.add_columns(experiment.id, add_request)
-            
-            # Validate response
-            assert "message" in result
-            
-            # Verify columns were added
-            updated_experiment = experiment_api.get(experiment.id)
-            assert len(updated_experiment.columns) == 2  # Original 1 + 1 new
-            
-        finally:
-            # Clean up
-            experiment_api.delete(experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_add_columns_async(self, experiment_api, test_column, test_row):
-        """Test adding columns to an experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        add_request = AddExperimentColumnsRequest(columns=[new_column])
+        result = await call(experiment_api, mode, "add_columns", created_experiment.id, add_request)
         
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_AddColumns_{timestamp}",
-            description="Async test experiment for adding columns",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = await experiment_api.acreate(experiment_data)
+        # Validate response
+        assert "message" in result
         
-        try:
-            # Add more columns
-            new_column = ExperimentColumnType(
-                model="gpt-4",
-                name="SDK Test Async GPT-4 Column",
-                temperature=0.5,
-                max_completion_tokens=400,
-                top_p=1.0,
-                frequency_penalty=0.0,
-                presence_penalty=0.0,
-                prompt_messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a precise assistant for async SDK testing."
-                    },
-                    {
-                        "role": "user",
-                        "content": "{{user_input}}"
-                    }
-                ],
-                tools=[],
-                tool_choice="auto",
-                response_format={"type": "text"}
-            )
-            
-            add_request = AddExperimentColumnsRequest(columns=[new_column])
-            result = await experiment_api.aadd_columns(experiment.id, add_request)
-            
-            # Validate response
-            assert "message" in result
-            
-            # Verify columns were added
-            updated_experiment = await experiment_api.aget(experiment.id)
-            assert len(updated_experiment.columns) == 2  # Original 1 + 1 new
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(experiment.id)
+        # Verify columns were added
+        updated_experiment = await call(experiment_api, mode, "get", created_experiment.id)
+        assert len(updated_experiment.columns) == 2  # Original 1 + 1 new
 
 
 class TestExperimentExecution:
     """Test experiment execution operations"""
-    
-    def test_run_experiment_sync(self, experiment_api, test_column, test_row):
-        """Test running an experiment synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Run_{timestamp}",
-            description="Test experiment for running",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = experiment_api.create(experiment_data)
-        
-        try:
-            # Run experiment
-            result = experiment_api.run_experiment(experiment.id)
-            
-            # Validate response
-            assert "message" in result or "experiment_id" in result
-            
-        finally:
-            # Clean up
-            experiment_api.delete(experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_run_experiment_async(self, experiment_api, test_column, test_row):
-        """Test running an experiment asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_Run_{timestamp}",
-            description="Async test experiment for running",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = await experiment_api.acreate(experiment_data)
-        
-        try:
-            # Run experiment
-            result = await experiment_api.arun_experiment(experiment.id)
-            
-            # Validate response
-            assert "message" in result or "experiment_id" in result
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(experiment.id)
-
-    def test_run_experiment_evals_sync(self, experiment_api, test_column, test_row):
-        """Test running experiment evaluations synchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    @MODES
+    async def test_run_experiment(self, mode, experiment_api, shared_experiment):
+        """Test running an experiment"""
+        result = await call(experiment_api, mode, "run_experiment", shared_experiment.id)
         
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_RunEvals_{timestamp}",
-            description="Test experiment for running evaluations",
-            columns=[test_column],
-            rows=[test_row]
+        # Validate response
+        assert "message" in result or "experiment_id" in result
+
+    @MODES
+    async def test_run_experiment_evals(self, mode, experiment_api, shared_experiment):
+        """Test running experiment evaluations"""
+        evals_request = RunExperimentEvalsRequest(
+            evaluator_slugs=["is_english"]  # Using a common evaluator
         )
-        experiment = experiment_api.create(experiment_data)
-        
-        try:
-            # Run evaluations
-            evals_request = RunExperimentEvalsRequest(
-                evaluator_slugs=["is_english"]  # Using a common evaluator
-            )
-            result = experiment_api.run_experiment_evals(experiment.id, evals_request)
-            
-            # Validate response
-            assert "message" in result or "experiment_id" in result
-            
-        finally:
-            # Clean up
-            experiment_api.delete(experiment.id)
-
-    @pytest.mark.asyncio
-    async def test_run_experiment_evals_async(self, experiment_api, test_column, test_row):
-        """Test running experiment evaluations asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create experiment first
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Async_RunEvals_{timestamp}",
-            description="Async test experiment for running evaluations",
-            columns=[test_column],
-            rows=[test_row]
+        result = await call(
+            experiment_api, mode, "run_experiment_evals", shared_experiment.id, evals_request
         )
-        experiment = await experiment_api.acreate(experiment_data)
         
-        try:
-            # Run evaluations
-            evals_request = RunExperimentEvalsRequest(
-                evaluator_slugs=["is_english"]  # Using a common evaluator
-            )
-            result = await experiment_api.arun_experiment_evals(experiment.id, evals_request)
-            
-            # Validate response
-            assert "message" in result or "experiment_id" in result
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(experiment.id)
+        # Validate response
+        assert "message" in result or "experiment_id" in result
 
 
 class TestExperimentWorkflow:
     """Test complete experiment workflows"""
     
-    @pytest.mark.asyncio
-    async def test_complete_experiment_workflow_async(self, experiment_api, test_column, test_row):
+    async def test_complete_experiment_workflow_async(self, experiment_api, created_experiment):
         """Test a complete experiment workflow asynchronously"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Step 1: Create experiment
-        experiment_data = ExperimentCreate(
-            name=f"SDK_TEST_Workflow_{timestamp}",
-            description="Complete workflow test experiment",
-            columns=[test_column],
-            rows=[test_row]
-        )
-        experiment = await experiment_api.acreate(experiment_data)
-        
-        try:
-            # Step 2: Add more rows
-            new_rows = [
-                ExperimentRowType(
-                    input={"user_input": "What is machine learning?"}
-                )
-            ]
-            add_rows_request = AddExperimentRowsRequest(rows=new_rows)
-            await experiment_api.aadd_rows(experiment.id, add_rows_request)
-            
-            # Step 3: Add more columns
-            new_column = ExperimentColumnType(
-                model="gpt-4",
-                name="Workflow Test GPT-4",
-                temperature=0.2,
-                max_completion_tokens=200,
-                top_p=1.0,
-                frequency_penalty=0.0,
-                presence_penalty=0.0,
-                prompt_messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a concise assistant."
-                    },
-                    {
-                        "role": "user",
-                        "content": "{{user_input}}"
-                    }
-                ],
-                tools=[],
-                tool_choice="auto",
-                response_format={"type": "text"}
+        experiment = created_experiment
+
+        # Step 1: Add more rows
+        new_rows = [
+            ExperimentRowType(
+                input={"user_input": "What is machine learning?"}
             )
-            add_columns_request = AddExperimentColumnsRequest(columns=[new_column])
-            await experiment_api.aadd_columns(experiment.id, add_columns_request)
-            
-            # Step 4: Verify final state
-            final_experiment = await experiment_api.aget(experiment.id)
-            assert len(final_experiment.rows) == 2  # Original + 1 new
-            assert len(final_experiment.columns) == 2  # Original + 1 new
-            
-            # Step 5: Run experiment (optional - may take time)
-            # run_result = await experiment_api.arun_experiment(experiment.id)
-            # assert "message" in run_result or "experiment_id" in run_result
-            
-        finally:
-            # Clean up
-            await experiment_api.adelete(experiment.id)
\ No newline at end of file
+        ]
+        add_rows_request = AddExperimentRowsRequest(rows=new_rows)
+        await experiment_api.aadd_rows(experiment.id, add_rows_request)
+        
+        # Step 2: Add more columns
+        new_column = sample_column("Workflow Test GPT-4", temperature=0.2)
+        add_columns_request = AddExperimentColumnsRequest(columns=[new_column])
+        await experiment_api.aadd_columns(experiment.id, add_columns_request)
+        
+        # Step 3: Verify final state
+        final_experiment = await experiment_api.aget(experiment.id)
+        assert len(final_experiment.rows) == 2  # Original + 1 new
+        assert len(final_experiment.columns) == 2  # Original + 1 new
+        
+        # Step 4: Run experiment (optional - may take time)
+        # run_result = await experiment_api.arun_experiment(experiment.id)
+        # assert "message" in run_result or "experiment_id" in run_result
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for lazy package exports
+
+Checks that ``import respan`` defers loading the API modules and that every
+public name still resolves on first access.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import respan
+import respan.evaluators
+import respan.logs
+import respan.utils
+
+LAZY_PACKAGES = [respan, respan.logs, respan.evaluators, respan.utils]
+
+
+class TestLazyExports:
+    """Unit tests for the PEP 562 loaders in the package __init__ modules"""
+
+    @pytest.mark.parametrize("package", LAZY_PACKAGES, ids=lambda p: p.__name__)
+    def test_all_names_are_lazy(self, package):
+        """Test that __all__ and the lazy lookup table list the same names"""
+        assert set(package.__all__) == set(package._LAZY_IMPORTS)
+
+    @pytest.mark.parametrize(
+        "package, name",
+        [(package, name) for package in LAZY_PACKAGES for name in package.__all__],
+    )
+    def test_name_resolves(self, package, name):
+        """Test that every exported name can be accessed"""
+        assert getattr(package, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            respan.NotARespanName
+
+    def test_import_does_not_load_http_stack(self):
+        """Test that a bare import leaves httpx and pydantic unloaded"""
+        code = (
+            "import sys, respan, respan.logs, respan.evaluators; "
+            "print('httpx' in sys.modules or 'pydantic' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_api_modules_defer_httpx(self):
+        """Test that loading the API modules imports httpx only once a client is built"""
+        code = (
+            "import sys, respan.logs.api, respan.evaluators.api; "
+            "print('httpx' in sys.modules); "
+            "respan.logs.api.LogAPI(api_key='test-key'); "
+            "print('httpx' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_eager_imports_env_var(self):
+        """Test that RESPAN_EAGER_IMPORTS=1 resolves every export at import time"""
+        code = "import respan; print(all(n in vars(respan) for n in respan.__all__))"
+        env = {**os.environ, "RESPAN_EAGER_IMPORTS": "1"}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert result.stdout.strip() == "True"
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for LogBatchCollector
+
+Covers the SDK-side buffering logic (flush triggers, concurrency bound and
+error collection). ``LogAPI.acreate`` is replaced by a local coroutine so no
+network calls are made.
+"""
+
+import asyncio
+
+import pytest
+from respan.logs.api import LogAPI, LogBatchCollector
+
+
+def _log(i: int) -> dict:
+    return {"model": "gpt-4", "input": f"question {i}", "output": "answer", "status_code": 200}
+
+
+@pytest.fixture
+def log_api():
+    """LogAPI whose acreate records the logs it receives instead of posting them"""
+    api = LogAPI(api_key="test-key", base_url="http://test.com")
+    api.sent = []
+    api.in_flight = 0
+    api.max_in_flight = 0
+
+    async def fake_acreate(log_data):
+        api.in_flight += 1
+        api.max_in_flight = max(api.max_in_flight, api.in_flight)
+        await asyncio.sleep(0)
+        api.in_flight -= 1
+        if log_data.input == "fail":
+            raise RuntimeError("create failed")
+        api.sent.append(log_data.input)
+        return {"message": "log successful"}
+
+    api.acreate = fake_acreate
+    return api
+
+
+class TestLogBatchCollector:
+    """Unit tests for buffering and flushing logs"""
+
+    def test_batch_returns_collector(self, log_api):
+        """Test that LogAPI.batch() builds a configured collector"""
+        batch = log_api.batch(max_items=5, flush_interval=0.5, max_concurrency=2)
+        assert isinstance(batch, LogBatchCollector)
+        assert (batch.max_items, batch.flush_interval, batch.max_concurrency) == (5, 0.5, 2)
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_full(self, log_api):
+        """Test that reaching max_items sends the buffered logs"""
+        batch = log_api.batch(max_items=3, flush_interval=60)
+        for i in range(3):
+            await batch.add(_log(i))
+        assert log_api.sent == ["question 0", "question 1", "question 2"]
+        await batch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self, log_api):
+        """Test that buffered logs are sent once flush_interval elapses"""
+        async with log_api.batch(max_items=100, flush_interval=0.01) as batch:
+            await batch.add(_log(0))
+            assert log_api.sent == []
+            await asyncio.sleep(0.05)
+            assert log_api.sent == ["question 0"]
+
+    @pytest.mark.asyncio
+    async def test_exit_flushes_remaining_logs(self, log_api):
+        """Test that leaving the context manager sends what is still buffered"""
+        async with log_api.batch(max_items=100, flush_interval=60) as batch:
+            for i in range(4):
+                await batch.add(_log(i))
+        assert len(log_api.sent) == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, log_api):
+        """Test that a flush keeps at most max_concurrency requests in flight"""
+        async with log_api.batch(max_items=100, max_concurrency=2) as batch:
+            for i in range(10):
+                await batch.add(_log(i))
+        assert len(log_api.sent) == 10
+        assert log_api.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_collected(self, log_api):
+        """Test that a failed log does not stop the others and is reported"""
+        async with log_api.batch() as batch:
+            await batch.add({**_log(0), "input": "fail"})
+            await batch.add(_log(1))
+        assert log_api.sent == ["question 1"]
+        assert len(batch.errors) == 1
+
+    @pytest.mark.asyncio
+    async def test_size_triggered_flush_failures_are_collected(self, log_api):
+        """Test that failures from a flush triggered by max_items are reported"""
+        batch = log_api.batch(max_items=2, flush_interval=60)
+        await batch.add({**_log(0), "input": "fail"})
+        await batch.add(_log(1))
+        assert log_api.sent == ["question 1"]
+        assert len(batch.errors) == 1
+        await batch.aclose()
+
+    @pytest.mark.asyncio
+    async def test_invalid_log_raises_on_add(self, log_api):
+        """Test that validation errors surface at the add() call site"""
+        batch = log_api.batch()
+        with pytest.raises(ValueError):
+            await batch.add("not a log")
+
+
+class TestCreateBatch:
+    """Unit tests for LogAPI.acreate_batch / create_batch"""
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order(self, log_api):
+        """Test that responses and failures line up with the input logs"""
+        logs = [_log(0), {**_log(1), "input": "fail"}, _log(2)]
+        results = await log_api.acreate_batch(logs, max_concurrency=2)
+        assert results[0] == {"message": "log successful"}
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == {"message": "log successful"}
+        assert log_api.max_in_flight <= 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_log_sends_nothing(self, log_api):
+        """Test that validation runs for every log before any request is sent"""
+        with pytest.raises(ValueError):
+            await log_api.acreate_batch([_log(0), "not a log"])
+        assert log_api.sent == []
+
+    def test_sync_create_batch(self, log_api):
+        """Test that the sync variant returns per-log results in order"""
+
+        def fake_create(log_data):
+            if log_data.input == "fail":
+                raise RuntimeError("create failed")
+            return {"message": log_data.input}
+
+        log_api.create = fake_create
+        results = log_api.create_batch([_log(0), {**_log(1), "input": "fail"}], max_concurrency=2)
+        assert results[0] == {"message": "question 0"}
+        assert isinstance(results[1], RuntimeError)